@@ -0,0 +1,157 @@
+import argparse
+import os
+import tempfile
+import time
+from crawler_module import NaverWordbookCrawler
+from mock_wordbook_server import MockWordbookConfig, MockWordbookServer
+
+# 모의 단어장 서버를 대상으로 헤드리스 브라우저 크롤링의 처리량과 페이지별 지연 시간을 측정합니다.
+
+
+def _percentile(sorted_values, ratio):
+    if not sorted_values:
+        return 0.0
+    idx = min(len(sorted_values) - 1, int(round(ratio * (len(sorted_values) - 1))))
+    return sorted_values[idx]
+
+
+def _instrument(crawler, page_timings):
+    """페이지 추출/이동 메소드를 감싸 호출마다 소요 시간을 기록합니다."""
+    original_extract = crawler._extract_words_from_current_page
+    original_navigate = crawler._navigate_to_next_page
+
+    def timed_extract():
+        started = time.perf_counter()
+        rows = original_extract()
+        page_timings.append(("extract", time.perf_counter() - started, len(rows)))
+        return rows
+
+    def timed_navigate():
+        started = time.perf_counter()
+        moved = original_navigate()
+        page_timings.append(("navigate", time.perf_counter() - started, 0))
+        return moved
+
+    crawler._extract_words_from_current_page = timed_extract
+    crawler._navigate_to_next_page = timed_navigate
+
+
+def run_benchmark(pages, cards_per_page=20, latency_ms=0, jitter_ms=0, fail_rate=0.0,
+                  headless=True, verbose=False, recycle_after_pages=None, settle_delay=0.0,
+                  crawler_factory=NaverWordbookCrawler):
+    """
+    모의 서버를 띄우고 지정된 페이지 수만큼 크롤링한 뒤 측정 결과를 딕셔너리로 반환합니다.
+    백엔드와 관계없이 크롤러의 고정 대기 시간을 모두 settle_delay로 맞춰 프로토콜 비용만 비교되도록 합니다.
+    """
+    config = MockWordbookConfig(
+        wordbooks={"단어": pages * cards_per_page},
+        cards_per_page=cards_per_page,
+        latency_ms=latency_ms,
+        jitter_ms=jitter_ms,
+        fail_rate=fail_rate,
+        seed=0,
+    )
+    page_timings = []
+    crawler = crawler_factory(status_callback=print if verbose else (lambda message: None), headless=headless,
+                              recycle_after_pages=recycle_after_pages)
+    crawler.card_settle_delay = crawler.scroll_settle_delay = crawler.page_settle_delay = settle_delay
+    _instrument(crawler, page_timings)
+
+    with MockWordbookServer(config) as server, tempfile.TemporaryDirectory() as tmp_dir:
+        output_filepath = os.path.join(tmp_dir, "benchmark.csv")
+        try:
+            started = time.perf_counter()
+            crawler.setup_driver_and_navigate(server.main_url)
+            setup_seconds = time.perf_counter() - started
+
+            if not crawler.select_wordbook("단어"):
+                raise RuntimeError("모의 서버에서 '단어' 단어장을 선택하지 못했습니다.")
+
+            crawler.settle_seconds_total = 0.0
+            started = time.perf_counter()
+            crawler.crawl_wordbook_pages(num_pages=pages, output_filepath=output_filepath)
+            crawl_seconds = time.perf_counter() - started
+            settle_seconds = crawler.settle_seconds_total
+        finally:
+            crawler.quit_driver()
+
+    extract_times = sorted(t for kind, t, _ in page_timings if kind == "extract")
+    navigate_times = sorted(t for kind, t, _ in page_timings if kind == "navigate")
+    total_rows = sum(rows for kind, _, rows in page_timings if kind == "extract")
+    return {
+        "pages": len(extract_times),
+        "rows": total_rows,
+        "setup_seconds": setup_seconds,
+        "crawl_seconds": crawl_seconds,
+        "settle_seconds": settle_seconds,
+        # 고정 대기를 뺀 페이지당 평균 소요 시간 (브라우저 제어 및 페이지 로드 비용)
+        "page_seconds_excluding_settle": (crawl_seconds - settle_seconds) / len(extract_times) if extract_times else 0.0,
+        "pages_per_second": len(extract_times) / crawl_seconds if crawl_seconds else 0.0,
+        "rows_per_second": total_rows / crawl_seconds if crawl_seconds else 0.0,
+        "extract_p50": _percentile(extract_times, 0.5),
+        "extract_p95": _percentile(extract_times, 0.95),
+        "navigate_p50": _percentile(navigate_times, 0.5),
+        "navigate_p95": _percentile(navigate_times, 0.95),
+    }
+
+
+def format_result(result):
+    return "\n".join([
+        f"브라우저 준비: {result['setup_seconds']:.2f}초",
+        f"크롤링: {result['pages']} 페이지 / {result['rows']}개 단어, {result['crawl_seconds']:.2f}초",
+        f"처리량: {result['pages_per_second']:.2f} 페이지/초, {result['rows_per_second']:.1f} 단어/초",
+        f"고정 대기: {result['settle_seconds']:.2f}초, 대기 제외 페이지당 평균: {result['page_seconds_excluding_settle'] * 1000:.0f}ms",
+        f"페이지 추출 p50/p95: {result['extract_p50'] * 1000:.0f}ms / {result['extract_p95'] * 1000:.0f}ms",
+        f"페이지 이동 p50/p95: {result['navigate_p50'] * 1000:.0f}ms / {result['navigate_p95'] * 1000:.0f}ms",
+    ])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="모의 단어장 서버 대상 크롤링 벤치마크")
+    parser.add_argument("--pages", type=int, default=20, help="크롤링할 페이지 수")
+    parser.add_argument("--cards-per-page", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=0)
+    parser.add_argument("--jitter-ms", type=float, default=0)
+    parser.add_argument("--fail-rate", type=float, default=0.0)
+    parser.add_argument("--backend", choices=("selenium", "cdp", "both"), default="selenium",
+                        help="브라우저 제어 방식 (both: 두 방식을 차례로 실행해 비교)")
+    parser.add_argument("--settle-delay", type=float, default=0.0,
+                        help="크롤러 고정 대기 시간 (초, 모든 백엔드에 동일 적용)")
+    parser.add_argument("--recycle-after-pages", type=int, default=None, help="이 페이지 수마다 브라우저 재시작")
+    parser.add_argument("--show-browser", action="store_true", help="헤드리스 대신 브라우저 창을 띄워 실행")
+    parser.add_argument("--verbose", action="store_true", help="크롤러 진행 로그 출력")
+    args = parser.parse_args()
+
+    backends = ("selenium", "cdp") if args.backend == "both" else (args.backend,)
+    results = {}
+    for backend in backends:
+        if backend == "cdp":
+            from cdp_backend import CdpWordbookCrawler
+            crawler_factory = CdpWordbookCrawler
+        else:
+            crawler_factory = NaverWordbookCrawler
+        results[backend] = run_benchmark(
+            pages=args.pages,
+            cards_per_page=args.cards_per_page,
+            latency_ms=args.latency_ms,
+            jitter_ms=args.jitter_ms,
+            fail_rate=args.fail_rate,
+            headless=not args.show_browser,
+            verbose=args.verbose,
+            recycle_after_pages=args.recycle_after_pages,
+            settle_delay=args.settle_delay,
+            crawler_factory=crawler_factory,
+        )
+        print(f"[{backend}]")
+        print(format_result(results[backend]))
+
+    if len(results) == 2:
+        # 페이지당 소요 시간 = 고정 대기를 뺀 전체 크롤링 시간 / 페이지 수 (두 백엔드의 고정 대기는 동일)
+        per_page = {name: r['page_seconds_excluding_settle'] for name, r in results.items()}
+        if per_page['cdp']:
+            print(f"대기 제외 페이지당 지연 시간: selenium {per_page['selenium'] * 1000:.0f}ms, cdp {per_page['cdp'] * 1000:.0f}ms "
+                  f"({per_page['selenium'] / per_page['cdp']:.1f}배)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,417 @@
+import itertools
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+import urllib.request
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+import websocket # websocket-client (Selenium 4 의존성으로 함께 설치됨)
+from selenium.common.exceptions import TimeoutException
+from crawler_module import NaverWordbookCrawler, psutil
+
+# ChromeDriver(WebDriver HTTP) 대신 Chrome DevTools Protocol 웹소켓으로 Chrome을 직접 제어하는 브라우저 백엔드.
+# 명령은 하나의 웹소켓에서 비동기로 다중 처리되고, 대기는 폴링 대신 DOM 변경(MutationObserver)/페이지 이벤트로 처리합니다.
+
+# Chrome 실행 파일 후보 (환경 변수 CHROME_BINARY가 있으면 우선 사용)
+CHROME_CANDIDATES = (
+    "google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome",
+    r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+    r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+)
+
+# 요소가 조건을 만족할 때까지 MutationObserver로 기다리는 함수 (조건 충족 시 true, 시간 초과 시 false로 resolve)
+WAIT_FOR_SELECTOR_FUNCTION = """
+function (selector, mustBeVisible, timeoutMs) {
+    function check() {
+        var el = document.querySelector(selector);
+        if (!el) return false;
+        if (!mustBeVisible) return true;
+        var style = window.getComputedStyle(el);
+        return style.display !== 'none' && style.visibility !== 'hidden' && el.getClientRects().length > 0;
+    }
+    return new Promise(function (resolve) {
+        if (check()) { resolve(true); return; }
+        var observer = new MutationObserver(function () {
+            if (check()) { observer.disconnect(); clearTimeout(timer); resolve(true); }
+        });
+        observer.observe(document, {childList: true, subtree: true, attributes: true});
+        var timer = setTimeout(function () { observer.disconnect(); resolve(check()); }, timeoutMs);
+    });
+}
+"""
+
+# 다음 페이지 버튼을 클릭하고, 해당 버튼이 is-active가 되고 카드 섹션이 보일 때까지 한 번의 호출 안에서 대기하는 함수
+CLICK_NEXT_PAGE_FUNCTION = """
+function (nextPage, timeoutMs) {
+    function findButton() {
+        var buttons = document.querySelectorAll('#page_area #page_list button.page_num');
+        for (var i = 0; i < buttons.length; i++) {
+            if (buttons[i].textContent.trim() === String(nextPage)) return buttons[i];
+        }
+        return null;
+    }
+    function loaded() {
+        var button = findButton();
+        var section = document.getElementById('section_word_card');
+        return !!(button && button.classList.contains('is-active') && section && section.getClientRects().length > 0);
+    }
+    var button = findButton();
+    if (!button) return Promise.resolve('missing');
+    if (button.disabled || button.getClientRects().length === 0) return Promise.resolve('disabled');
+    button.scrollIntoView(true);
+    button.click();
+    return new Promise(function (resolve) {
+        if (loaded()) { resolve('ok'); return; }
+        var observer = new MutationObserver(function () {
+            if (loaded()) { observer.disconnect(); clearTimeout(timer); resolve('ok'); }
+        });
+        observer.observe(document, {childList: true, subtree: true, attributes: true});
+        var timer = setTimeout(function () { observer.disconnect(); resolve(loaded() ? 'ok' : 'timeout'); }, timeoutMs);
+    });
+}
+"""
+
+# Network.setCookies가 받는 쿠키 필드
+CDP_COOKIE_FIELDS = ('name', 'value', 'domain', 'path', 'secure', 'httpOnly', 'sameSite', 'expires')
+
+
+class CdpError(Exception):
+    """CDP 명령이 오류 응답을 반환했을 때 발생합니다."""
+
+
+class CdpConnection:
+    """
+    CDP 웹소켓 연결. 명령마다 id를 붙여 여러 명령을 동시에 보내고(다중화), 응답은 Future로 돌려받습니다.
+    id가 없는 메시지(이벤트)는 등록된 리스너에게 전달합니다.
+    """
+
+    def __init__(self, ws_url):
+        self.ws = websocket.create_connection(ws_url, suppress_origin=True, enable_multithread=True)
+        self.ids = itertools.count(1)
+        self.pending = {} # 명령 id -> Future
+        self.listeners = {} # 이벤트 이름 -> 콜백 목록
+        self.lock = threading.Lock()
+        self.closed = False
+        self.reader = threading.Thread(target=self._read_loop, daemon=True)
+        self.reader.start()
+
+    def _read_loop(self):
+        while not self.closed:
+            try:
+                message = json.loads(self.ws.recv())
+            except Exception as e: # 연결 종료 등: 대기 중인 명령을 모두 실패 처리
+                with self.lock:
+                    pending, self.pending = self.pending, {}
+                for future in pending.values():
+                    future.set_exception(CdpError(f"CDP 연결이 끊어졌습니다: {e}"))
+                return
+            if 'id' in message:
+                with self.lock:
+                    future = self.pending.pop(message['id'], None)
+                if future is None:
+                    continue
+                if 'error' in message:
+                    future.set_exception(CdpError(message['error'].get('message', str(message['error']))))
+                else:
+                    future.set_result(message.get('result', {}))
+            else:
+                with self.lock:
+                    callbacks = list(self.listeners.get(message.get('method'), ()))
+                for callback in callbacks:
+                    try:
+                        callback(message.get('params', {}))
+                    except Exception as e: # 콜백 오류로 수신 스레드가 멈추면 이후 모든 명령이 응답을 받지 못함
+                        print(f"CDP 이벤트 콜백 오류 ({message.get('method')}): {e}")
+
+    def _send(self, method, params=None):
+        command_id = next(self.ids)
+        future = Future()
+        with self.lock:
+            self.pending[command_id] = future
+        self.ws.send(json.dumps({'id': command_id, 'method': method, 'params': params or {}}))
+        return command_id, future
+
+    def send(self, method, params=None):
+        """명령을 보내고 결과를 받을 Future를 즉시 반환합니다. (응답을 기다리지 않음)"""
+        return self._send(method, params)[1]
+
+    def call(self, method, params=None, timeout=30):
+        """명령을 보내고 결과를 기다립니다."""
+        command_id, future = self._send(method, params)
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError:
+            with self.lock: # 응답이 끝내 오지 않는 명령의 Future가 계속 쌓이지 않도록 제거
+                self.pending.pop(command_id, None)
+            raise TimeoutException(f"CDP 명령 {method} 응답 시간 초과")
+
+    def on(self, event_name, callback):
+        with self.lock:
+            self.listeners.setdefault(event_name, []).append(callback)
+
+    def off(self, event_name, callback):
+        with self.lock:
+            if callback in self.listeners.get(event_name, []):
+                self.listeners[event_name].remove(callback)
+
+    def expect_event(self, event_name, predicate=None):
+        """다음 이벤트를 받을 Future를 반환합니다. 이벤트를 일으키는 명령보다 먼저 호출해야 놓치지 않습니다."""
+        future = Future()
+
+        def callback(params):
+            if future.done(): # 취소된 대기는 다음 이벤트 때 리스너만 정리
+                self.off(event_name, callback)
+            elif predicate is None or predicate(params):
+                self.off(event_name, callback)
+                future.set_result(params)
+        self.on(event_name, callback)
+        return future
+
+    def close(self):
+        self.closed = True
+        try:
+            self.ws.close()
+        except Exception:
+            pass
+
+
+class CdpBrowser:
+    """
+    CDP로 제어하는 Chrome 한 개. NaverWordbookCrawler가 사용하는 WebDriver 기능
+    (get, current_url, page_source, execute_script, execute_cdp_cmd, get_cookies, add_cookie, quit)을 같은 이름으로 제공합니다.
+    """
+
+    def __init__(self, headless=False, chrome_binary=None, startup_timeout=30):
+        chrome_binary = chrome_binary or find_chrome_binary()
+        self.profile_dir = tempfile.mkdtemp(prefix="wordbook-cdp-")
+        args = [
+            chrome_binary,
+            "--remote-debugging-port=0", # 빈 포트 자동 선택 (DevToolsActivePort 파일로 확인)
+            f"--user-data-dir={self.profile_dir}",
+            "--no-first-run",
+            "--no-default-browser-check",
+            "--disable-gpu",
+        ]
+        if headless:
+            args += ["--headless=new", "--window-size=1280,1024"]
+        args.append("about:blank")
+        self.process = subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            port = self._wait_for_debugging_port(startup_timeout)
+            self.connection = CdpConnection(self._page_websocket_url(port))
+            # Network 도메인은 쿠키 명령에 필요 없고, 켜면 모든 요청 이벤트가 수신 스레드로 전달되므로 켜지 않음
+            for domain in ('Page', 'Runtime'):
+                self.connection.call(f'{domain}.enable')
+        except Exception:
+            self.quit()
+            raise
+
+    def _wait_for_debugging_port(self, timeout):
+        port_file = os.path.join(self.profile_dir, "DevToolsActivePort")
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                raise Exception(f"Chrome이 시작 직후 종료되었습니다. (종료 코드 {self.process.returncode})")
+            try:
+                with open(port_file, 'r') as f:
+                    port = f.readline().strip()
+                if port:
+                    return int(port)
+            except (OSError, ValueError):
+                pass
+            time.sleep(0.05)
+        raise TimeoutException("Chrome 원격 디버깅 포트를 확인하지 못했습니다.")
+
+    def _page_websocket_url(self, port):
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/json/list", timeout=10) as response:
+            targets = json.load(response)
+        for target in targets:
+            if target.get('type') == 'page':
+                return target['webSocketDebuggerUrl']
+        raise Exception("제어할 Chrome 탭을 찾지 못했습니다.")
+
+    def execute_cdp_cmd(self, method, params=None):
+        return self.connection.call(method, params)
+
+    def call_function(self, function_declaration, *args, timeout=30):
+        """페이지에서 JS 함수를 인자와 함께 호출하고, Promise면 완료까지 기다린 뒤 결과 값을 반환합니다."""
+        expression = f"({function_declaration}).apply(null, {json.dumps(list(args), ensure_ascii=False)})"
+        result = self.connection.call('Runtime.evaluate', {
+            'expression': expression,
+            'returnByValue': True,
+            'awaitPromise': True,
+        }, timeout=timeout)
+        if 'exceptionDetails' in result:
+            details = result['exceptionDetails']
+            raise CdpError(details.get('exception', {}).get('description') or details.get('text', 'JavaScript 오류'))
+        return result.get('result', {}).get('value')
+
+    def execute_script(self, script, *args):
+        """WebDriver의 execute_script와 같이 함수 본문(script)을 arguments와 함께 실행합니다."""
+        return self.call_function(f"function () {{ {script} }}", *args)
+
+    def get(self, url, timeout=60):
+        """URL로 이동합니다. 문서가 바뀌면 load 이벤트까지, 해시만 바뀌면 문서 내 이동 이벤트까지 기다립니다."""
+        load_event = self.connection.expect_event('Page.loadEventFired')
+        same_document_event = self.connection.expect_event('Page.navigatedWithinDocument')
+        result = self.connection.call('Page.navigate', {'url': url}, timeout=timeout)
+        if result.get('errorText'):
+            raise Exception(f"페이지 이동 실패: {result['errorText']}")
+        waited = load_event if result.get('loaderId') else same_document_event
+        try:
+            waited.result(timeout)
+        except FutureTimeoutError:
+            raise TimeoutException(f"{url} 로드 시간 초과")
+        finally:
+            # 기다리지 않은 쪽 리스너는 다음 get()에서 잘못 반응하지 않도록 취소
+            for future in (load_event, same_document_event):
+                if not future.done():
+                    future.cancel()
+
+    @property
+    def current_url(self):
+        return self.call_function("function () { return window.location.href; }")
+
+    @property
+    def page_source(self):
+        return self.call_function("function () { return document.documentElement.outerHTML; }")
+
+    def get_cookies(self):
+        return self.connection.call('Network.getAllCookies').get('cookies', [])
+
+    def add_cookie(self, cookie):
+        self.connection.call('Network.setCookie', {k: v for k, v in cookie.items() if k in CDP_COOKIE_FIELDS})
+
+    def quit(self):
+        connection = getattr(self, 'connection', None)
+        if connection is not None:
+            try:
+                connection.send('Browser.close')
+            except Exception:
+                pass
+            connection.close()
+        if self.process.poll() is None:
+            try:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+        shutil.rmtree(self.profile_dir, ignore_errors=True)
+
+
+def find_chrome_binary():
+    """환경 변수 CHROME_BINARY 또는 알려진 설치 위치에서 Chrome 실행 파일을 찾습니다."""
+    candidates = [os.environ.get("CHROME_BINARY")] + list(CHROME_CANDIDATES)
+    for candidate in candidates:
+        if not candidate:
+            continue
+        path = shutil.which(candidate) or (candidate if os.path.isfile(candidate) else None)
+        if path:
+            return path
+    raise Exception("Chrome 실행 파일을 찾을 수 없습니다. CHROME_BINARY 환경 변수로 경로를 지정해주세요.")
+
+
+class CdpWordbookCrawler(NaverWordbookCrawler):
+    """
+    NaverWordbookCrawler와 같은 인터페이스로 동작하되, ChromeDriver 대신 CDP로 Chrome을 제어하는 크롤러.
+    대기는 MutationObserver/페이지 이벤트로 처리하고, 페이지 이동은 클릭과 로드 확인을 한 번의 호출로 끝냅니다.
+    """
+
+    def __init__(self, *args, chrome_binary=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.chrome_binary = chrome_binary
+        # 카드 렌더링과 페이지 이동 완료를 DOM 변경으로 확인하므로 고정 대기는 기본적으로 사용하지 않음
+        self.card_settle_delay = 0
+        self.scroll_settle_delay = 0
+        self.page_settle_delay = 0
+
+    def _create_driver(self):
+        self._log_status("Chrome을 원격 디버깅(CDP) 모드로 실행 중...")
+        self.driver = CdpBrowser(headless=self.headless, chrome_binary=self.chrome_binary)
+        self.pages_since_recycle = 0
+        self._log_status("CDP 연결이 성공적으로 설정되었습니다.")
+
+    def _wait_for_selector(self, css_selector, must_be_visible, timeout):
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutException(f"'{css_selector}' 요소 대기 시간 초과")
+            try:
+                if self.driver.call_function(WAIT_FOR_SELECTOR_FUNCTION, css_selector, must_be_visible,
+                                             int(remaining * 1000), timeout=remaining + 5):
+                    return
+            except CdpError:
+                # 대기 중 문서가 바뀌면 실행 컨텍스트가 사라져 오류가 나므로 새 문서에서 다시 대기
+                time.sleep(0.05)
+
+    def _wait_until_present(self, css_selector, timeout):
+        self._wait_for_selector(css_selector, False, timeout)
+
+    def _wait_until_visible(self, css_selector, timeout):
+        self._wait_for_selector(css_selector, True, timeout)
+
+    def _wait_for_document_ready(self, timeout):
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutException("문서 로드 대기 시간 초과")
+            try:
+                if self.driver.call_function("""
+                    function () {
+                        if (document.readyState === 'complete') return true;
+                        return new Promise(function (resolve) { window.addEventListener('load', function () { resolve(true); }); });
+                    }""", timeout=remaining):
+                    return
+            except CdpError:
+                # 로드 중 문서가 바뀌어 실행 컨텍스트가 사라진 경우 새 문서에서 다시 대기
+                time.sleep(0.05)
+
+    def _browser_processes(self):
+        # ChromeDriver 없이 Chrome을 직접 실행하므로 Chrome 메인 프로세스와 그 하위 프로세스를 합산
+        browser_process = psutil.Process(self.driver.process.pid)
+        return [browser_process] + browser_process.children(recursive=True)
+
+    def _restore_session_cookies(self, cookies, url):
+        # CDP는 현재 페이지 도메인과 무관하게 쿠키를 넣을 수 있어 먼저 접속할 필요가 없음
+        self.driver.execute_cdp_cmd('Network.setCookies', {
+            'cookies': [{k: v for k, v in cookie.items() if k in CDP_COOKIE_FIELDS} for cookie in cookies]
+        })
+
+    def _navigate_to_next_page(self):
+        """다음 페이지 버튼 클릭과 새 페이지 로드 확인을 한 번의 CDP 호출로 처리합니다."""
+        if not self.driver:
+            self._log_status("오류: 브라우저가 초기화되지 않아 페이지 이동 불가.")
+            return False
+
+        next_page_to_click = self.current_selenium_page + 1
+        self._log_status(f"다음 페이지({next_page_to_click})로 이동 시도...")
+        try:
+            self._wait_until_present('#page_area', 10)
+            outcome = self.driver.call_function(CLICK_NEXT_PAGE_FUNCTION, next_page_to_click, 15000, timeout=20)
+        except TimeoutException:
+            self._log_status(f"페이지 {next_page_to_click}로 이동 또는 로드 확인 중 시간 초과.")
+            return False
+        except Exception as e:
+            self._log_status(f"페이지 이동 중 예기치 않은 오류 발생: {e}")
+            return False
+
+        if outcome == 'missing':
+            self._log_status(f"페이지 {next_page_to_click} 버튼을 찾을 수 없습니다. 마지막 페이지일 가능성이 높습니다.")
+            return False
+        if outcome == 'disabled':
+            self._log_status(f"페이지 {next_page_to_click} 버튼이 클릭 가능한 상태가 아닙니다.")
+            return False
+        if outcome != 'ok':
+            self._log_status(f"페이지 {next_page_to_click}로 이동 또는 로드 확인 중 시간 초과.")
+            return False
+
+        # 스크롤과 클릭을 한 번의 호출로 처리하므로 Selenium 방식의 두 고정 대기를 이동 후에 한꺼번에 적용
+        self._settle(self.scroll_settle_delay + self.page_settle_delay)
+        self.current_selenium_page = next_page_to_click
+        self._log_status(f"성공적으로 {self.current_selenium_page} 페이지로 이동했습니다.")
+        return True
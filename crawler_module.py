@@ -9,12 +9,97 @@ from bs4 import BeautifulSoup
 import time
 import os
 import csv
+import difflib
+import re
+import unicodedata
+from urllib.parse import urlparse
+
+try:
+    import psutil # 선택 의존성: 브라우저 메모리 한도(memory_limit_mb)에 따른 재시작에 필요
+except ImportError:
+    psutil = None
+
+# 단어장 목록(li.item_folder)의 이름, wbId, 링크 URL을 한 번에 수집하는 스크립트
+WORDBOOK_LIST_SCRIPT = """
+var items = document.querySelectorAll('#main_folder ul.list_folder li.item_folder._item_folder');
+var result = [];
+for (var i = 0; i < items.length; i++) {
+    var link = items[i].querySelector('a.folder_inner._btn_cards_link');
+    var nameSpan = link && link.querySelector('div.folder_tit span.name');
+    if (!nameSpan) continue;
+    var match = /[?&]wbId=([^&]+)/.exec(link.getAttribute('href') || '');
+    result.push({name: nameSpan.textContent, wbId: match ? decodeURIComponent(match[1]) : '', url: link.href});
+}
+return result;
+"""
+
+# wbId가 같은 단어장 링크가 화면에 있으면 클릭하고, 없으면 URL로 직접 이동하는 스크립트
+OPEN_WORDBOOK_SCRIPT = """
+var wbId = arguments[0], url = arguments[1];
+var links = document.querySelectorAll('#main_folder li.item_folder._item_folder a.folder_inner._btn_cards_link');
+for (var i = 0; i < links.length; i++) {
+    if (wbId && (links[i].getAttribute('href') || '').indexOf('wbId=' + wbId) !== -1) {
+        links[i].scrollIntoView(true);
+        links[i].click();
+        return 'click';
+    }
+}
+window.location.href = url;
+return 'url';
+"""
+
+
+# 페이지네이션에서 현재 활성화된 페이지 번호를 읽는 스크립트 (없으면 null)
+ACTIVE_PAGE_SCRIPT = """
+var active = document.querySelector('#page_area #page_list button.page_num.is-active');
+return active ? parseInt(active.textContent.trim(), 10) : null;
+"""
+
+# 목표 페이지 이하인 페이지 버튼 중 가장 큰 번호를 클릭하고 그 번호를 반환하는 스크립트 (없으면 null)
+JUMP_TOWARDS_PAGE_SCRIPT = """
+var target = arguments[0], best = null, bestNum = 0;
+var buttons = document.querySelectorAll('#page_area #page_list button.page_num');
+for (var i = 0; i < buttons.length; i++) {
+    var num = parseInt(buttons[i].textContent.trim(), 10);
+    if (num <= target && num > bestNum) { best = buttons[i]; bestNum = num; }
+}
+if (!best || best.classList.contains('is-active')) return null;
+best.click();
+return bestNum;
+"""
+
+# 크롤링 결과 CSV의 기본 열 (사전 색인을 사용하면 DictionaryIndex.COLUMNS가 뒤에 추가됨)
+CSV_HEADERS = ["히라가나", "한자", "품사", "뜻", "예문", "메모"]
+
+
+def normalize_wordbook_name(name):
+    """단어장 이름 비교용 정규화: 전각/반각 통일(NFKC), 모든 공백 제거, 대소문자 무시."""
+    return re.sub(r'\s+', '', unicodedata.normalize('NFKC', name)).casefold()
+
 
 class NaverWordbookCrawler:
-    def __init__(self, status_callback=None):
+    def __init__(self, status_callback=None, headless=False, dictionary_index=None,
+                 recycle_after_pages=None, memory_limit_mb=None):
         self.driver = None
         self.status_callback = status_callback # GUI 업데이트를 위한 콜백 함수
+        self.headless = headless # 브라우저 창 없이 실행 (모의 서버 대상 테스트/벤치마크용)
+        self.dictionary_index = dictionary_index # JLPT/빈도/다른 읽기 열을 덧붙일 DictionaryIndex (선택)
         self.current_selenium_page = 1 # 단어 카드 목록 페이지 내에서의 현재 페이지 번호
+        self.wordbook_cache = {} # 단어장 이름 -> {'wbId', 'url'} (fetch_wordbook_list에서 채움)
+        self.wordbook_main_url = None # 단어장 목록 페이지 URL (setup_driver_and_navigate에서 설정)
+        self.selected_wordbook = None # 마지막으로 선택한 단어장 {'name', 'wbId'}
+        # 긴 크롤링에서 브라우저 메모리가 계속 늘어나는 것을 막기 위한 브라우저 재시작 조건 (None이면 사용 안 함)
+        self.recycle_after_pages = recycle_after_pages # 이 페이지 수만큼 이동할 때마다 재시작
+        self.memory_limit_mb = memory_limit_mb # 브라우저 메모리가 이 값(MB)을 넘으면 재시작 (psutil 필요)
+        self.memory_check_interval = 10 # 메모리 측정 주기 (페이지 수)
+        self.memory_check_available = True # 메모리를 측정할 수 없으면 False로 바뀌어 메모리 기준 재시작을 끔
+        self.pages_since_recycle = 0
+        self.chromedriver_path = None # ChromeDriverManager 설치 경로 (재시작 시 재사용)
+        # 고정 대기 시간 (초). 벤치마크는 백엔드 간 프로토콜 비용만 비교하도록 모든 백엔드에 같은 값을 설정함
+        self.card_settle_delay = 0.5 # 카드가 보인 뒤 나머지 카드 렌더링을 기다리는 시간
+        self.scroll_settle_delay = 0.2 # 페이지 버튼으로 스크롤한 뒤 기다리는 시간
+        self.page_settle_delay = 1.0 # 페이지 이동 후 DOM 안정화를 기다리는 시간
+        self.settle_seconds_total = 0.0 # 위 고정 대기로 보낸 누적 시간
 
     def _log_status(self, message):
         """GUI 또는 콘솔에 진행 상황 메시지를 로깅합니다."""
@@ -25,14 +110,12 @@ class NaverWordbookCrawler:
 
     def setup_driver_and_navigate(self, url):
         """WebDriver를 설정하고 주어진 URL로 이동합니다."""
+        self.wordbook_main_url = url
         if self.driver: # 이미 드라이버가 실행 중인 경우
             try:
                 self._log_status(f"이미 실행 중인 브라우저로 {url} 페이지로 이동합니다...")
                 self.driver.get(url)
-                # 페이지 로드 완료 확인 (document.readyState)
-                WebDriverWait(self.driver, 15).until(
-                    lambda d: d.execute_script('return document.readyState') == 'complete'
-                )
+                self._wait_for_document_ready(15) # 페이지 로드 완료 확인 (document.readyState)
                 self._log_status("페이지 이동 완료.")
                 # 단어장 목록 페이지로 이동한 것이므로, 페이지 번호는 여기서 초기화하지 않음
                 return
@@ -40,91 +123,278 @@ class NaverWordbookCrawler:
                 self._log_status(f"기존 브라우저로 페이지 이동 중 오류: {e}. 새 브라우저를 시도합니다.")
                 self.quit_driver() # 기존 드라이버 문제 시 종료 후 새로 시작
 
-        # WebDriver 옵션 설정
-        options = webdriver.ChromeOptions()
-        options.add_experimental_option('excludeSwitches', ['enable-logging']) # 콘솔 로그 줄이기
-        options.add_argument("--disable-gpu") # GUI 없는 환경 또는 일부 시스템에서 필요
-        options.add_argument("--log-level=3") # Selenium 로그 레벨 설정
-
         try:
-            self._log_status("ChromeDriver 자동 설정 중...")
-            service = ChromeService(ChromeDriverManager().install()) # ChromeDriver 자동 설치 및 경로 설정
-            self.driver = webdriver.Chrome(service=service, options=options)
-            self.driver.set_page_load_timeout(60) # 페이지 로드 최대 대기 시간 (초)
-            self._log_status("WebDriver가 성공적으로 설정되었습니다.")
+            self._create_driver()
             
             self._log_status(f"{url} 페이지로 이동합니다...")
             self.driver.get(url)
             # 페이지의 기본 구조(예: <div id="wrap">)가 로드될 때까지 대기
-            WebDriverWait(self.driver, 30).until(
-                EC.presence_of_element_located((By.ID, 'wrap'))
-            )
+            self._wait_until_present('#wrap', 30)
             self._log_status("페이지 기본 로드 완료. 브라우저에서 직접 로그인을 진행해주세요.")
         except Exception as e:
             self._log_status(f"WebDriver 설정 또는 페이지 이동 중 오류 발생: {e}")
             self.quit_driver() # 실패 시 드라이버 정리
             raise # 오류를 호출한 곳으로 다시 전달하여 GUI에 표시되도록 함
 
+    def _create_driver(self):
+        """Chrome WebDriver를 새로 띄워 self.driver에 설정합니다."""
+        # WebDriver 옵션 설정
+        options = webdriver.ChromeOptions()
+        options.add_experimental_option('excludeSwitches', ['enable-logging']) # 콘솔 로그 줄이기
+        options.add_argument("--disable-gpu") # GUI 없는 환경 또는 일부 시스템에서 필요
+        options.add_argument("--log-level=3") # Selenium 로그 레벨 설정
+        if self.headless:
+            options.add_argument("--headless=new")
+            options.add_argument("--window-size=1280,1024") # 헤드리스 기본 창 크기가 작아 요소가 가려지는 것 방지
+
+        if not self.chromedriver_path:
+            self._log_status("ChromeDriver 자동 설정 중...")
+            self.chromedriver_path = ChromeDriverManager().install() # ChromeDriver 자동 설치 및 경로 설정
+        service = ChromeService(self.chromedriver_path)
+        self.driver = webdriver.Chrome(service=service, options=options)
+        self.driver.set_page_load_timeout(60) # 페이지 로드 최대 대기 시간 (초)
+        self.pages_since_recycle = 0
+        self._log_status("WebDriver가 성공적으로 설정되었습니다.")
+
+    # --- 대기 헬퍼: 브라우저 백엔드(예: cdp_backend.CdpWordbookCrawler)가 이벤트 기반 대기로 재정의할 수 있음 ---
+
+    def _wait_until_present(self, css_selector, timeout):
+        """CSS 선택자에 맞는 요소가 DOM에 생길 때까지 대기합니다. 시간 초과 시 TimeoutException."""
+        WebDriverWait(self.driver, timeout).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, css_selector))
+        )
+
+    def _wait_until_visible(self, css_selector, timeout):
+        """CSS 선택자에 맞는 요소가 화면에 보일 때까지 대기합니다. 시간 초과 시 TimeoutException."""
+        WebDriverWait(self.driver, timeout).until(
+            EC.visibility_of_element_located((By.CSS_SELECTOR, css_selector))
+        )
+
+    def _wait_for_document_ready(self, timeout):
+        """document.readyState가 'complete'가 될 때까지 대기합니다. 시간 초과 시 TimeoutException."""
+        WebDriverWait(self.driver, timeout).until(
+            lambda d: d.execute_script('return document.readyState') == 'complete'
+        )
+
+    def _settle(self, seconds):
+        """고정 대기 시간만큼 쉬고, 벤치마크에서 따로 보고할 수 있도록 누적합니다."""
+        if seconds:
+            time.sleep(seconds)
+            self.settle_seconds_total += seconds
+
+    def _browser_processes(self):
+        """메모리를 합산할 브라우저 프로세스 목록 (chromedriver 하위의 모든 Chrome 프로세스)."""
+        driver_process = psutil.Process(self.driver.service.process.pid)
+        return driver_process.children(recursive=True)
+
+    def _browser_memory_mb(self):
+        """
+        브라우저 프로세스 전체의 메모리 사용량(RSS, MB)을 반환합니다. 측정할 수 없으면 None.
+        JS 힙 사용량은 RSS보다 훨씬 작아 한도 비교에 쓸 수 없으므로 psutil로 측정할 수 있을 때만 값을 반환합니다.
+        """
+        if psutil is None:
+            return None
+        try:
+            return sum(process.memory_info().rss for process in self._browser_processes()) / (1024 * 1024)
+        except (psutil.Error, AttributeError): # 원격 드라이버 등 프로세스에 접근할 수 없는 경우
+            return None
+
+    def _should_recycle_browser(self):
+        """설정된 페이지 수 또는 메모리 한도(memory_check_interval 페이지마다 측정)에 도달했는지 확인합니다."""
+        if self.recycle_after_pages and self.pages_since_recycle >= self.recycle_after_pages:
+            self._log_status(f"{self.pages_since_recycle}페이지를 이동해 브라우저를 재시작합니다.")
+            return True
+        if (self.memory_limit_mb and self.memory_check_available
+                and self.pages_since_recycle % max(1, self.memory_check_interval) == 0):
+            memory_mb = self._browser_memory_mb()
+            if memory_mb is None:
+                self.memory_check_available = False
+                self._log_status("브라우저 메모리를 측정할 수 없어 (psutil 필요) 메모리 한도에 따른 브라우저 재시작을 사용하지 않습니다.")
+            elif memory_mb >= self.memory_limit_mb:
+                self._log_status(f"브라우저 메모리 {memory_mb:.0f}MB가 한도 {self.memory_limit_mb}MB를 넘어 브라우저를 재시작합니다.")
+                return True
+        return False
+
+    def _get_session_cookies(self):
+        return self.driver.get_cookies()
+
+    def _restore_session_cookies(self, cookies, url):
+        """새 브라우저에 이전 세션의 쿠키를 넣습니다. (쿠키 도메인의 페이지에 먼저 접속해야 함)"""
+        parsed = urlparse(url)
+        self.driver.get(f"{parsed.scheme}://{parsed.netloc}/")
+        for cookie in cookies:
+            cookie = {key: value for key, value in cookie.items() if key in ('name', 'value', 'domain', 'path', 'secure', 'httpOnly', 'expiry', 'sameSite')}
+            try:
+                self.driver.add_cookie(cookie)
+            except Exception as e: # 다른 도메인 쿠키 등은 건너뜀
+                self._log_status(f"쿠키 '{cookie.get('name')}' 복원 실패: {e}")
+
+    def _active_page_number(self):
+        try:
+            return self.driver.execute_script(ACTIVE_PAGE_SCRIPT)
+        except Exception:
+            return None
+
+    def _jump_to_page(self, target_page):
+        """
+        페이지네이션에 보이는 버튼 중 목표 이하의 가장 큰 번호를 반복 클릭해 목표 페이지로 이동합니다.
+        (한 페이지씩 이동하는 것보다 훨씬 적은 클릭으로 도달) 성공 시 True를 반환합니다.
+        """
+        current_page = self._active_page_number() or 1
+        while current_page < target_page:
+            clicked_page = self.driver.execute_script(JUMP_TOWARDS_PAGE_SCRIPT, target_page)
+            if not clicked_page:
+                self._log_status(f"페이지 {target_page}(으)로 가는 버튼을 찾지 못했습니다. (현재 {current_page} 페이지)")
+                return False
+            WebDriverWait(self.driver, 15).until(lambda d: self._active_page_number() == clicked_page)
+            current_page = clicked_page
+        self._wait_until_visible('#section_word_card', 10)
+        return current_page == target_page
+
+    def recycle_browser(self):
+        """
+        현재 브라우저를 종료하고 새로 띄운 뒤, 세션 쿠키를 옮기고 크롤링 중이던 페이지로 돌아갑니다.
+        실패하면 예외를 발생시킵니다.
+        """
+        resume_url = self.driver.current_url
+        resume_page = self.current_selenium_page
+        cookies = self._get_session_cookies()
+        wordbook_cache = self.wordbook_cache # quit_driver가 비우는 캐시는 같은 세션이므로 유지
+
+        self.quit_driver()
+        self.wordbook_cache = wordbook_cache
+        self._create_driver()
+        self._restore_session_cookies(cookies, resume_url)
+
+        self.driver.get(resume_url)
+        self._wait_until_visible('#section_word_card', 20)
+        # URL에 페이지 정보가 있으면 바로 복귀하고, 아니면 페이지 버튼을 눌러 이동
+        if not self._jump_to_page(resume_page):
+            raise Exception(f"브라우저 재시작 후 {resume_page} 페이지로 돌아가지 못했습니다.")
+        self.current_selenium_page = resume_page
+        self._log_status(f"브라우저 재시작 완료. {resume_page} 페이지부터 계속합니다.")
+
+    def fetch_wordbook_list(self, refresh=False):
+        """
+        단어장 목록 페이지의 모든 단어장 정보(이름, wbId, URL)를 한 번의 스크립트 실행으로 가져와 캐시합니다.
+        단어장 이름 목록을 반환하며, 목록을 찾지 못하면 이전에 캐시된 목록(없으면 빈 리스트)을 반환합니다.
+        """
+        if self.wordbook_cache and not refresh:
+            return list(self.wordbook_cache.keys())
+
+        self._log_status("단어장 목록을 불러오는 중...")
+        try:
+            # 크롤링 후에는 단어 카드 페이지(#/my/cards)에 있어 목록이 숨겨져 있으므로 목록 페이지로 돌아감
+            if self.wordbook_main_url and "#/my/cards" in self.driver.current_url:
+                self.driver.get(self.wordbook_main_url)
+            # 단어장 목록을 포함하는 컨테이너(#main_folder)가 화면에 보일 때까지 대기
+            self._wait_until_visible('#main_folder', 20)
+        except TimeoutException:
+            self._log_status("단어장 목록(#main_folder)을 시간 내에 찾지 못했습니다. 로그인이 정상적으로 되었는지 확인해주세요.")
+            return list(self.wordbook_cache.keys())
+
+        # 항목마다 find_element/.text를 호출하면 매번 WebDriver 왕복이 발생하므로 브라우저 안에서 한 번에 수집
+        items = self.driver.execute_script(WORDBOOK_LIST_SCRIPT) or []
+
+        self.wordbook_cache = {}
+        for item in items:
+            name = (item.get('name') or '').strip()
+            if not name or name in self.wordbook_cache: # 이름이 없거나 중복된 항목은 첫 번째 것만 사용
+                continue
+            self.wordbook_cache[name] = {'wbId': item.get('wbId', ''), 'url': item.get('url', '')}
+
+        if not self.wordbook_cache:
+            self._log_status("단어장 목록(li.item_folder)이 비어있습니다. 단어장을 추가했는지 확인해주세요.")
+        else:
+            self._log_status(f"단어장 {len(self.wordbook_cache)}개를 찾았습니다: {', '.join(self.wordbook_cache)}")
+        return list(self.wordbook_cache.keys())
+
+    def find_wordbook_name(self, wordbook_name_to_find):
+        """
+        캐시된 단어장 목록에서 입력한 이름과 같은 단어장 이름을 찾습니다.
+        정확히 일치 → 정규화 후 일치(전각/반각, 공백, 대소문자 무시) 순으로 검색하며, 없으면 None을 반환합니다.
+        """
+        if wordbook_name_to_find in self.wordbook_cache:
+            return wordbook_name_to_find
+
+        target = normalize_wordbook_name(wordbook_name_to_find)
+        for name in self.wordbook_cache:
+            if normalize_wordbook_name(name) == target:
+                return name
+        return None
+
+    def suggest_wordbook_name(self, wordbook_name_to_find):
+        """
+        일치하는 단어장이 없을 때 안내용으로 가장 비슷한 단어장 이름을 반환합니다. (없으면 None)
+        'JLPT N2'와 'JLPT N3'처럼 다른 단어장일 수 있으므로 자동 선택에는 사용하지 않습니다.
+        """
+        normalized_names = {}
+        for name in self.wordbook_cache:
+            normalized_names.setdefault(normalize_wordbook_name(name), name)
+        close_matches = difflib.get_close_matches(normalize_wordbook_name(wordbook_name_to_find), list(normalized_names), n=1, cutoff=0.6)
+        return normalized_names[close_matches[0]] if close_matches else None
+
+    def resolve_wordbook_name(self, wordbook_name_to_find):
+        """
+        입력한 이름과 일치하는 단어장 이름을 찾습니다. 캐시에 없으면 새로 만든 단어장일 수 있으므로 목록을 한 번 다시 불러옵니다.
+        """
+        refreshed = not self.wordbook_cache
+        if refreshed:
+            self.fetch_wordbook_list()
+        matched_name = self.find_wordbook_name(wordbook_name_to_find)
+        if matched_name is None and not refreshed:
+            self.fetch_wordbook_list(refresh=True)
+            matched_name = self.find_wordbook_name(wordbook_name_to_find)
+        return matched_name
+
     def select_wordbook(self, wordbook_name_to_find):
         """
-        현재 열려있는 단어장 목록 페이지에서 지정된 이름의 단어장을 찾아 클릭합니다.
+        단어장 목록에서 지정된 이름의 단어장을 찾아 해당 단어 카드 목록 페이지로 이동합니다.
+        이름이 정확히(또는 정규화 후) 일치하는 단어장만 선택하며, 성공 시 True, 실패 시 False를 반환합니다.
+        """
+        self._log_status(f"'{wordbook_name_to_find}' 단어장을 찾는 중...")
+        self.selected_wordbook = None
+        try:
+            matched_name = self.resolve_wordbook_name(wordbook_name_to_find)
+        except Exception as e:
+            self._log_status(f"단어장 선택 중 예상치 못한 오류 발생: {e}")
+            return False
+        if matched_name is None:
+            suggestion = self.suggest_wordbook_name(wordbook_name_to_find)
+            hint = f" 비슷한 이름의 단어장: '{suggestion}'" if suggestion else ""
+            self._log_status(f"실패: '{wordbook_name_to_find}' 이름의 단어장을 목록에서 찾을 수 없습니다.{hint}")
+            return False
+        return self.open_wordbook(matched_name)
+
+    def open_wordbook(self, matched_name):
+        """
+        resolve_wordbook_name으로 찾은(캐시된 목록에 있는) 단어장의 단어 카드 목록 첫 페이지로 이동합니다.
         성공 시 True, 실패 시 False를 반환합니다.
         """
-        self._log_status(f"단어장 목록 페이지에서 '{wordbook_name_to_find}' 단어장을 찾는 중...")
+        self.selected_wordbook = None
         try:
-            # 단어장 목록을 포함하는 컨테이너(#main_folder)가 화면에 보일 때까지 대기
-            folder_list_container = WebDriverWait(self.driver, 20).until(
-                EC.visibility_of_element_located((By.ID, 'main_folder'))
-            )
-            # 실제 단어장 목록(ul.list_folder) 가져오기
-            actual_list_ul = folder_list_container.find_element(By.CSS_SELECTOR, 'ul.list_folder')
-            
-            self._log_status("단어장 목록 로드 확인됨. 단어장 검색 시작...")
-            wordbook_items = actual_list_ul.find_elements(By.CSS_SELECTOR, 'li.item_folder._item_folder') # 각 단어장 항목
-            
-            if not wordbook_items:
-                self._log_status("단어장 목록(li.item_folder)이 비어있습니다. 단어장을 추가했는지 확인해주세요.")
-                return False
+            wordbook = self.wordbook_cache[matched_name]
 
-            found_link_element = None
-            for item_idx, item_element in enumerate(wordbook_items):
-                try:
-                    # 각 단어장 항목 내의 링크(a) 태그와 이름(span.name) 태그를 찾음
-                    link_tag = item_element.find_element(By.CSS_SELECTOR, 'a.folder_inner._btn_cards_link')
-                    name_span = link_tag.find_element(By.CSS_SELECTOR, 'div.folder_tit span.name')
-                    current_wordbook_name = name_span.text.strip() # 단어장 이름 텍스트 추출 및 공백 제거
-                    
-                    self._log_status(f"  {item_idx+1}. 발견된 단어장: '{current_wordbook_name}'") # 찾은 단어장 이름 로깅
-                    
-                    if current_wordbook_name == wordbook_name_to_find: # 사용자가 입력한 이름과 일치하는지 확인
-                        found_link_element = link_tag
-                        self._log_status(f"성공: '{wordbook_name_to_find}' 단어장을 찾았습니다.")
-                        break # 일치하는 단어장을 찾으면 루프 종료
-                except NoSuchElementException:
-                    self._log_status(f"  {item_idx+1}. 단어장 항목 내 이름 태그(span.name)를 찾지 못했습니다. 다음 항목으로 넘어갑니다.")
-                    continue # 현재 항목에서 구조가 다르거나 이름이 없으면 다음 항목으로
-            
-            if found_link_element:
-                self._log_status(f"'{wordbook_name_to_find}' 단어장으로 이동합니다...")
-                # 클릭하기 전에 해당 요소가 화면에 보이도록 스크롤 (필요시)
-                self.driver.execute_script("arguments[0].scrollIntoView(true);", found_link_element)
-                time.sleep(0.3) # 스크롤 후 안정화 시간
-                found_link_element.click() # 단어장 링크 클릭
-                
-                # 단어 카드 목록 페이지로 성공적으로 이동했는지 확인
-                # 1. URL에 '#/my/cards'가 포함될 때까지 대기
-                WebDriverWait(self.driver, 15).until(lambda driver: "#/my/cards" in driver.current_url)
-                # 2. 단어 카드 섹션(#section_word_card)이 화면에 보일 때까지 대기
-                WebDriverWait(self.driver, 20).until(
-                    EC.visibility_of_element_located((By.ID, 'section_word_card'))
-                )
+            # 이전 크롤링으로 단어 카드 페이지에 있으면 이전 카드가 보이는 상태라 아래 대기가 바로 통과하고,
+            # 링크 주소가 현재 주소와 같으면 이동 자체가 일어나지 않으므로 목록 페이지로 먼저 돌아감
+            if self.wordbook_main_url and "#/my/cards" in self.driver.current_url:
+                self.driver.get(self.wordbook_main_url)
+                self._wait_until_visible('#main_folder', 20)
 
-                self.current_selenium_page = 1 # 단어 카드 목록의 첫 페이지로 진입했으므로 페이지 번호 초기화
-                self._log_status("단어 카드 목록 페이지로 성공적으로 이동했습니다.")
-                return True
-            else:
-                self._log_status(f"실패: '{wordbook_name_to_find}' 이름의 단어장을 목록에서 찾을 수 없습니다. 정확한 이름을 입력했는지 확인해주세요.")
-                return False
+            self._log_status(f"'{matched_name}' 단어장으로 이동합니다...")
+            # 목록 페이지에 링크가 있으면 클릭(SPA 라우팅 유지), 없으면 캐시된 URL로 직접 이동
+            self.driver.execute_script(OPEN_WORDBOOK_SCRIPT, wordbook['wbId'], wordbook['url'])
+
+            # 단어 카드 목록 페이지로 성공적으로 이동했는지 확인
+            # 1. URL에 '#/my/cards'가 포함될 때까지 대기
+            WebDriverWait(self.driver, 15).until(lambda driver: "#/my/cards" in driver.current_url)
+            # 2. 단어 카드 섹션(#section_word_card)이 화면에 보일 때까지 대기
+            self._wait_until_visible('#section_word_card', 20)
+
+            self.current_selenium_page = 1 # 단어 카드 목록의 첫 페이지로 진입했으므로 페이지 번호 초기화
+            self.selected_wordbook = {'name': matched_name, 'wbId': wordbook['wbId']}
+            self._log_status("단어 카드 목록 페이지로 성공적으로 이동했습니다.")
+            return True
 
         except TimeoutException:
             self._log_status("단어장 목록 또는 특정 요소를 찾는 중 시간 초과되었습니다. 페이지가 올바르게 로드되었는지, 로그인이 정상적으로 되었는지 확인해주세요.")
@@ -142,19 +412,15 @@ class NaverWordbookCrawler:
         try:
             # 단어 카드 섹션 로드 대기
             self._log_status("단어 카드 섹션(#section_word_card) 로딩 대기 중...")
-            main_card_section = WebDriverWait(self.driver, 20).until(
-                EC.visibility_of_element_located((By.ID, 'section_word_card'))
-            )
+            self._wait_until_visible('#section_word_card', 20)
             self._log_status("'section_word_card' 로드 및 확인됨.")
 
             # 실제 단어 카드(inner_card) 로드 대기
             self._log_status("실제 단어 카드(inner_card) 로딩 대기 중...")
             try:
-                WebDriverWait(main_card_section, 10).until( 
-                    EC.visibility_of_element_located((By.CLASS_NAME, 'inner_card'))
-                )
+                self._wait_until_visible('#section_word_card .inner_card', 10)
                 self._log_status("최소 하나의 'inner_card' 로드 및 확인됨.")
-                time.sleep(0.5) # 모든 카드가 완전히 로드되도록 약간의 추가 시간
+                self._settle(self.card_settle_delay) # 모든 카드가 완전히 로드되도록 약간의 추가 시간
             except TimeoutException:
                 self._log_status("시간 내에 'inner_card'를 찾지 못했습니다. 이 페이지에 단어가 없거나 로드되지 않았을 수 있습니다.")
                 return [] 
@@ -167,6 +433,10 @@ class NaverWordbookCrawler:
             return []
 
         html = self.driver.page_source # 현재 페이지의 HTML 소스 가져오기
+        return self._parse_word_cards(html)
+
+    def _parse_word_cards(self, html):
+        """페이지 HTML에서 단어 카드(inner_card)들을 파싱하여 CSV 행 데이터 리스트로 반환합니다."""
         soup = BeautifulSoup(html, 'html.parser') # HTML 파싱
         
         # 파싱된 HTML에서 단어 카드 섹션 찾기
@@ -320,7 +590,7 @@ class NaverWordbookCrawler:
             if next_page_button.is_displayed() and next_page_button.is_enabled(): # 버튼이 보이고 활성화되어 있다면
                 # 클릭 전 스크롤하여 버튼이 보이도록 함 (필요시)
                 self.driver.execute_script("arguments[0].scrollIntoView(true);", next_page_button)
-                time.sleep(0.2) # 스크롤 후 잠시 대기
+                self._settle(self.scroll_settle_delay) # 스크롤 후 잠시 대기
                 self.driver.execute_script("arguments[0].click();", next_page_button) # JavaScript로 클릭 (더 안정적일 수 있음)
                 
                 # 페이지 이동 및 로딩 대기
@@ -332,7 +602,7 @@ class NaverWordbookCrawler:
                 WebDriverWait(self.driver, 10).until(
                     EC.visibility_of_element_located((By.ID, 'section_word_card'))
                 )
-                time.sleep(1.0) # DOM 안정화 및 추가 JS 실행 대기
+                self._settle(self.page_settle_delay) # DOM 안정화 및 추가 JS 실행 대기
 
                 self.current_selenium_page = next_page_to_click # 현재 페이지 번호 업데이트
                 self._log_status(f"성공적으로 {self.current_selenium_page} 페이지로 이동했습니다.")
@@ -347,8 +617,12 @@ class NaverWordbookCrawler:
             self._log_status(f"페이지 이동 중 예기치 않은 오류 발생: {e}")
             return False
 
-    def crawl_wordbook_pages(self, num_pages, output_filepath):
-        """지정된 페이지 수만큼 단어장 페이지를 크롤링하여 CSV 파일로 저장합니다."""
+    def crawl_wordbook_pages(self, num_pages, output_filepath, stop_event=None):
+        """
+        지정된 페이지 수만큼 단어장 페이지를 크롤링하여 CSV 파일로 저장합니다.
+        stop_event(threading.Event)가 설정되면 다음 페이지로 넘어가기 전에 중단하고 파일을 저장하지 않습니다.
+        저장한 단어 수를 반환합니다.
+        """
         if not self.driver:
             self._log_status("오류: WebDriver가 설정되지 않았습니다. '브라우저 열기'를 먼저 실행해주세요.")
             raise Exception("WebDriver 미설정. 브라우저를 먼저 열어주세요.")
@@ -357,18 +631,22 @@ class NaverWordbookCrawler:
         
         # 사용자가 요청한 페이지 수만큼 반복 (1페이지부터 시작)
         for i in range(1, num_pages + 1):
+            if stop_event is not None and stop_event.is_set():
+                self._log_status("작업 취소 요청으로 크롤링을 중단합니다.")
+                return 0
+
             self._log_status(f"요청 {i}/{num_pages} 페이지 (실제 브라우저: {self.current_selenium_page} 페이지) 데이터 추출 시도...")
             
             try:
                 # 페이지가 완전히 로드될 때까지 (document.readyState) 대기
-                WebDriverWait(self.driver, 15).until(
-                    lambda d: d.execute_script('return document.readyState') == 'complete'
-                )
+                self._wait_for_document_ready(15)
             except TimeoutException:
                 self._log_status(f"{self.current_selenium_page} 페이지 로드 상태 확인 시간 초과. 계속 진행 시도.")
 
             # 현재 보이는 페이지에서 단어 데이터 추출
             page_csv_data = self._extract_words_from_current_page() 
+            if self.dictionary_index is not None: # 사전 색인이 있으면 각 행에 JLPT/빈도/다른 읽기 열 추가
+                page_csv_data = [self.dictionary_index.annotate_row(row) for row in page_csv_data]
             
             # 첫 페이지만 확인 (이후 페이지는 _navigate_to_next_page에서 존재 여부 판단)
             if not page_csv_data and i == 1 and self.current_selenium_page == 1 :
@@ -387,10 +665,21 @@ class NaverWordbookCrawler:
             if not self._navigate_to_next_page():
                 self._log_status("더 이상 다음 페이지로 이동할 수 없거나 오류 발생. 추출을 중단합니다.")
                 break # 다음 페이지 이동 실패 시 루프 종료
+
+            # 페이지 수/메모리 한도에 도달했으면 브라우저를 새로 띄워 같은 페이지에서 계속
+            self.pages_since_recycle += 1
+            if self._should_recycle_browser():
+                try:
+                    self.recycle_browser()
+                except Exception as e:
+                    self._log_status(f"브라우저 재시작 중 오류 발생: {e}. 지금까지 추출한 데이터만 저장합니다.")
+                    break
             
         # CSV 파일 저장
         if all_data_for_csv:
-            csv_headers = ["히라가나", "한자", "품사", "뜻", "예문", "메모"] 
+            csv_headers = list(CSV_HEADERS)
+            if self.dictionary_index is not None:
+                csv_headers += self.dictionary_index.COLUMNS
             self._log_status(f"총 {len(all_data_for_csv)}개의 단어 정보를 CSV 파일에 저장합니다...")
             try:
                 with open(output_filepath, 'w', newline='', encoding='utf-8-sig') as csvfile: # utf-8-sig로 Excel 호환성 높임
@@ -400,9 +689,10 @@ class NaverWordbookCrawler:
                 self._log_status(f"CSV 파일 저장 완료: {output_filepath}")
             except IOError as e:
                 self._log_status(f"파일 저장 중 오류 발생: {e}")
-                messagebox.showerror("파일 저장 오류", f"파일 저장 중 오류가 발생했습니다: {output_filepath}\n{e}")
+                raise # 호출한 곳(GUI 또는 내보내기 데몬)에서 오류를 표시하도록 전달
         else:
             self._log_status("추출된 단어가 없어 파일을 저장하지 않습니다.")
+        return len(all_data_for_csv)
 
 
     def quit_driver(self):
@@ -414,4 +704,5 @@ class NaverWordbookCrawler:
             except Exception as e: # 드라이버 종료 중 발생할 수 있는 예외 처리
                 self._log_status(f"WebDriver 종료 중 오류 발생: {e}")
             finally:
-                self.driver = None # 드라이버 참조 제거
\ No newline at end of file
+                self.driver = None # 드라이버 참조 제거
+                self.wordbook_cache = {} # 다른 계정으로 다시 로그인할 수 있으므로 단어장 목록 캐시도 비움
\ No newline at end of file
@@ -0,0 +1,268 @@
+import csv
+import gzip
+import json
+import os
+import re
+import unicodedata
+import xml.etree.ElementTree as ET
+
+# 로컬 사전 파일(JMdict, 빈도 목록, JLPT 목록)로 단어 카드에 JLPT 급수, 빈도 순위, 다른 읽기를 덧붙이는 오프라인 색인.
+# 원본 파일은 한 번만 파싱하고, 조회용으로 미리 계산한 색인을 JSON 캐시로 저장해 다음 실행부터 바로 불러옵니다.
+# (캐시는 사용자가 고른 사전 폴더에 저장되므로 불러올 때 코드가 실행될 수 있는 pickle은 사용하지 않음)
+
+INDEX_FORMAT_VERSION = 2
+DEFAULT_CACHE_FILENAME = ".wordbook_dictionary.idx"
+
+# 사전 폴더에서 자동으로 찾을 파일 이름 (소문자 비교)
+JMDICT_FILENAMES = ("jmdict_e.gz", "jmdict_e", "jmdict_e.xml", "jmdict.gz", "jmdict", "jmdict.xml")
+FREQUENCY_FILE_PATTERN = re.compile(r'^freq.*\.(tsv|txt|csv)$', re.IGNORECASE)
+JLPT_FILE_PATTERN = re.compile(r'^jlpt.*\.(tsv|txt|csv)$', re.IGNORECASE)
+
+JLPT_LEVEL_PATTERN = re.compile(r'^N?([1-5])$', re.IGNORECASE)
+JMDICT_NF_PATTERN = re.compile(r'^nf(\d\d)$')  # JMdict 빈도 표시 (nf01 = 상위 500단어, nf02 = 다음 500단어 ...)
+
+
+def normalize_key(text):
+    """조회 키 정규화: 전각/반각 통일(NFKC) 및 공백 제거."""
+    return re.sub(r'\s+', '', unicodedata.normalize('NFKC', text or ''))
+
+
+def _open_text(path):
+    if path.lower().endswith(".gz"):
+        return gzip.open(path, 'rt', encoding='utf-8')
+    return open(path, 'r', encoding='utf-8-sig')
+
+
+def _source_signature(paths):
+    """캐시 유효성 확인용: 원본 파일 경로, 크기, 수정 시각."""
+    signature = []
+    for path in paths:
+        if path:
+            stat = os.stat(path)
+            signature.append([os.path.abspath(path), stat.st_size, int(stat.st_mtime)])  # JSON 캐시 헤더와 비교하므로 리스트 사용
+        else:
+            signature.append(None)
+    return signature
+
+
+def _parse_jmdict(path):
+    """
+    JMdict XML을 스트리밍으로 파싱하여 (표기 목록, 읽기 목록, JMdict 빈도 순위) 튜플을 생성합니다.
+    표기가 없는(가나 전용) 단어는 표기 목록이 비어 있습니다.
+    """
+    with _open_text(path) as xml_file:
+        root = None
+        for event, elem in ET.iterparse(xml_file, events=('start', 'end')):
+            if root is None:
+                root = elem  # 첫 start 이벤트의 요소가 루트(<JMdict>)
+            if event != 'end' or elem.tag != 'entry':
+                continue
+            kebs = [k.findtext('keb') for k in elem.findall('k_ele') if k.findtext('keb')]
+            rebs = [r.findtext('reb') for r in elem.findall('r_ele') if r.findtext('reb')]
+            nf_rank = 0
+            for pri in elem.iter():
+                if pri.tag in ('ke_pri', 're_pri'):
+                    match = JMDICT_NF_PATTERN.match(pri.text or '')
+                    if match:
+                        rank = int(match.group(1)) * 500
+                        nf_rank = rank if not nf_rank else min(nf_rank, rank)
+            root.clear()  # 파싱이 끝난 항목을 루트에서 떼어내 메모리에서 해제 (elem.clear()만 하면 빈 요소가 루트에 계속 쌓임)
+            if rebs:
+                yield kebs, rebs, nf_rank
+
+
+def _parse_frequency_list(path):
+    """
+    빈도 목록을 읽어 {단어: 순위}를 반환합니다.
+    각 줄의 첫 번째 칸을 단어로, 마지막 칸이 숫자면 순위로 사용하고, 아니면 줄 순서를 순위로 사용합니다.
+    """
+    ranks = {}
+    with _open_text(path) as freq_file:
+        delimiter = '\t' if path.lower().endswith(('.tsv', '.txt')) else ','
+        for line_no, fields in enumerate(csv.reader(freq_file, delimiter=delimiter), start=1):
+            if not fields or not fields[0].strip() or fields[0].startswith('#'):
+                continue
+            word = normalize_key(fields[0])
+            rank = int(fields[-1]) if len(fields) > 1 and fields[-1].strip().isdigit() else line_no
+            if word not in ranks or rank < ranks[word]:
+                ranks[word] = rank
+    return ranks
+
+
+def _parse_jlpt_list(path):
+    """
+    JLPT 목록(단어, [읽기], 급수)을 읽어 {단어: 급수}, {(단어, 읽기): 급수}를 반환합니다.
+    급수는 'N1'~'N5' 또는 '1'~'5' 형식을 모두 허용하며 'N3'처럼 통일합니다.
+    """
+    by_word, by_pair = {}, {}
+    with _open_text(path) as jlpt_file:
+        delimiter = '\t' if path.lower().endswith(('.tsv', '.txt')) else ','
+        for fields in csv.reader(jlpt_file, delimiter=delimiter):
+            fields = [field.strip() for field in fields]
+            level = next((f"N{m.group(1)}" for m in map(JLPT_LEVEL_PATTERN.match, fields) if m), None)
+            if not fields or not level or not fields[0] or JLPT_LEVEL_PATTERN.match(fields[0]):
+                continue  # 헤더 줄이나 급수가 없는 줄은 건너뜀
+            word = normalize_key(fields[0])
+            by_word.setdefault(word, level)
+            if len(fields) > 2 and fields[1] and not JLPT_LEVEL_PATTERN.match(fields[1]):
+                by_pair.setdefault((word, normalize_key(fields[1])), level)
+    return by_word, by_pair
+
+
+class DictionaryIndex:
+    """표기/읽기 → (JLPT 급수, 빈도 순위, 다른 읽기) 조회용 색인."""
+
+    COLUMNS = ["JLPT", "빈도 순위", "다른 읽기"]
+    EMPTY_RECORD = ("", "", "")
+
+    def __init__(self, by_pair, by_surface):
+        # 값은 CSV에 바로 붙일 수 있도록 문자열로 미리 만들어 둔 (JLPT, 빈도 순위, 다른 읽기) 튜플
+        self.by_pair = by_pair        # "표기\t읽기" -> 레코드
+        self.by_surface = by_surface  # 표기 또는 읽기 -> 레코드 (가장 자주 쓰이는 항목)
+
+    def __len__(self):
+        return len(self.by_surface)
+
+    @classmethod
+    def build(cls, jmdict_path=None, frequency_path=None, jlpt_path=None):
+        """원본 사전 파일들을 파싱하여 색인을 만듭니다."""
+        freq_ranks = _parse_frequency_list(frequency_path) if frequency_path else {}
+        jlpt_by_word, jlpt_by_pair = _parse_jlpt_list(jlpt_path) if jlpt_path else ({}, {})
+        records = {}  # 같은 레코드 튜플을 공유해 메모리와 캐시 크기를 줄임
+        by_pair, by_surface, surface_rank = {}, {}, {}
+
+        def intern(record):
+            return records.setdefault(record, record)
+
+        def add_surface(key, record, rank):
+            # 동형이의어는 빈도 순위가 높은(숫자가 작은) 항목을 대표로 사용
+            sort_rank = rank or float('inf')
+            if key not in by_surface or sort_rank < surface_rank[key]:
+                by_surface[key] = record
+                surface_rank[key] = sort_rank
+
+        if jmdict_path:
+            for kebs, rebs, nf_rank in _parse_jmdict(jmdict_path):
+                kebs = [normalize_key(keb) for keb in kebs]
+                rebs = [normalize_key(reb) for reb in rebs]
+                # 한자 표기가 있으면 표기로만 순위를 찾음 (읽기로 찾으면 동음이의어가 모두 가장 흔한 단어의 순위를 받음)
+                rank = min((freq_ranks[w] for w in (kebs or rebs) if w in freq_ranks), default=nf_rank)
+                rank_text = str(rank) if rank else ""
+                for reading in rebs:
+                    other_readings = "・".join(r for r in rebs if r != reading)
+                    for surface in kebs or [reading]:
+                        level = jlpt_by_pair.get((surface, reading)) or jlpt_by_word.get(surface) or jlpt_by_word.get(reading, "")
+                        record = intern((level, rank_text, other_readings))
+                        by_pair[f"{surface}\t{reading}"] = record
+                        add_surface(surface, record, rank)  # 한자 표기만으로 조회하면 첫 번째 읽기 기준
+                    if kebs:
+                        # 히라가나만으로 조회하는 경우 (예: 네이버에 한자가 없는 카드)
+                        level = jlpt_by_pair.get((kebs[0], reading)) or jlpt_by_word.get(reading) or jlpt_by_word.get(kebs[0], "")
+                        add_surface(reading, intern((level, rank_text, other_readings)), rank)
+        else:
+            # JMdict 없이 빈도/JLPT 목록만 있는 경우: 단어 단위로만 조회
+            for word in set(freq_ranks) | set(jlpt_by_word):
+                rank = freq_ranks.get(word, 0)
+                add_surface(word, intern((jlpt_by_word.get(word, ""), str(rank) if rank else "", "")), rank)
+            for (word, reading), level in jlpt_by_pair.items():
+                rank = freq_ranks.get(word, 0)
+                by_pair[f"{word}\t{reading}"] = intern((level, str(rank) if rank else "", ""))
+
+        return cls(by_pair, by_surface)
+
+    @classmethod
+    def load(cls, jmdict_path=None, frequency_path=None, jlpt_path=None, cache_path=None, status_callback=None):
+        """
+        캐시가 원본 파일과 일치하면 캐시에서, 아니면 원본에서 색인을 만들고 캐시를 갱신합니다.
+        """
+        log = status_callback or print
+        signature = _source_signature((jmdict_path, frequency_path, jlpt_path))
+        if cache_path and os.path.exists(cache_path):
+            try:
+                index = cls._read_cache(cache_path, signature)
+                if index is not None:
+                    log(f"사전 색인 캐시를 불러왔습니다. ({len(index)}개 표제어)")
+                    return index
+            except (OSError, ValueError, KeyError, IndexError, TypeError) as e:
+                log(f"사전 색인 캐시를 읽지 못해 새로 만듭니다: {e}")
+
+        log("사전 파일로부터 색인을 만드는 중... (처음 한 번만 시간이 걸립니다)")
+        index = cls.build(jmdict_path, frequency_path, jlpt_path)
+        log(f"사전 색인 생성 완료. ({len(index)}개 표제어)")
+        if cache_path:
+            try:
+                index._write_cache(cache_path, signature)
+            except OSError as e:
+                log(f"사전 색인 캐시 저장 실패: {e}")
+        return index
+
+    @classmethod
+    def _read_cache(cls, cache_path, signature):
+        """
+        JSON 캐시를 읽습니다. 첫 줄은 헤더(형식 버전, 원본 파일 정보), 둘째 줄은 색인입니다.
+        헤더가 현재 원본 파일과 다르면 None을 반환합니다.
+        """
+        with open(cache_path, 'r', encoding='utf-8') as cache_file:
+            header = json.loads(cache_file.readline())
+            if header != {"version": INDEX_FORMAT_VERSION, "sources": signature}:
+                return None
+            data = json.loads(cache_file.readline())
+        records = [tuple(str(value) for value in record) for record in data["records"]]
+        by_pair = {key: records[record_no] for key, record_no in data["by_pair"].items()}
+        by_surface = {key: records[record_no] for key, record_no in data["by_surface"].items()}
+        return cls(by_pair, by_surface)
+
+    def _write_cache(self, cache_path, signature):
+        # 같은 레코드 튜플이 많으므로 레코드 목록을 한 번만 저장하고 색인에는 번호만 기록
+        record_numbers = {}
+        for record in list(self.by_pair.values()) + list(self.by_surface.values()):
+            record_numbers.setdefault(record, len(record_numbers))
+        data = {
+            "records": list(record_numbers),
+            "by_pair": {key: record_numbers[record] for key, record in self.by_pair.items()},
+            "by_surface": {key: record_numbers[record] for key, record in self.by_surface.items()},
+        }
+        with open(cache_path, 'w', encoding='utf-8') as cache_file:
+            cache_file.write(json.dumps({"version": INDEX_FORMAT_VERSION, "sources": signature}, ensure_ascii=False))
+            cache_file.write('\n')
+            cache_file.write(json.dumps(data, ensure_ascii=False, separators=(',', ':')))
+            cache_file.write('\n')
+
+    @classmethod
+    def from_directory(cls, folder, status_callback=None):
+        """
+        폴더에서 JMdict(JMdict_e[.gz]), 빈도 목록(freq*.tsv 등), JLPT 목록(jlpt*.csv 등)을 찾아 색인을 불러옵니다.
+        사용할 수 있는 파일이 하나도 없으면 None을 반환합니다.
+        """
+        jmdict_path = frequency_path = jlpt_path = None
+        for filename in sorted(os.listdir(folder)):
+            path = os.path.join(folder, filename)
+            lower_name = filename.lower()
+            if not os.path.isfile(path):
+                continue
+            if lower_name in JMDICT_FILENAMES and jmdict_path is None:
+                jmdict_path = path
+            elif FREQUENCY_FILE_PATTERN.match(filename) and frequency_path is None:
+                frequency_path = path
+            elif JLPT_FILE_PATTERN.match(filename) and jlpt_path is None:
+                jlpt_path = path
+        if not (jmdict_path or frequency_path or jlpt_path):
+            return None
+        return cls.load(jmdict_path, frequency_path, jlpt_path,
+                        cache_path=os.path.join(folder, DEFAULT_CACHE_FILENAME), status_callback=status_callback)
+
+    def lookup(self, kanji, hiragana):
+        """단어 카드의 한자/히라가나로 (JLPT, 빈도 순위, 다른 읽기) 튜플을 찾습니다. 없으면 빈 값 튜플."""
+        reading = normalize_key(hiragana)
+        # 네이버는 여러 표기를 '・'로 묶어 보여주는 경우가 있어 각 표기를 차례로 시도
+        for surface in [normalize_key(kanji)] + normalize_key(kanji).split('・'):
+            if not surface:
+                continue
+            record = self.by_pair.get(f"{surface}\t{reading}") or self.by_surface.get(surface)
+            if record:
+                return record
+        return self.by_surface.get(reading, self.EMPTY_RECORD)
+
+    def annotate_row(self, row):
+        """크롤러 CSV 행(히라가나, 한자, ...) 끝에 사전 정보 열을 덧붙인 새 행을 반환합니다."""
+        return list(row) + list(self.lookup(row[1], row[0]))
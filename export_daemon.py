@@ -0,0 +1,418 @@
+import argparse
+import itertools
+import json
+import os
+import queue
+import threading
+import time
+import uuid
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse
+from crawler_module import NaverWordbookCrawler, normalize_wordbook_name
+from dictionary_index import DictionaryIndex
+
+# 로그인된 브라우저를 계속 띄워둔 채로 내보내기(크롤링) 작업을 큐로 받아 처리하는 백그라운드 서비스.
+# 로컬 HTTP API로 작업을 등록/조회/취소하고 완료된 CSV를 바로 내려받을 수 있습니다.
+
+DEFAULT_MAIN_URL = "https://learn.dict.naver.com/wordbook/jakodict/#/my/main"
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+FINISHED_STATUSES = (JOB_DONE, JOB_FAILED, JOB_CANCELLED)
+
+MIN_JOB_RETENTION = 600  # cache_ttl이 0이어도 완료된 작업 결과를 내려받을 수 있도록 최소한 유지하는 시간 (초)
+
+
+class ExportJob:
+    """단어장 내보내기 작업 하나의 상태를 담습니다."""
+
+    def __init__(self, wordbook, pages, priority=0, use_cache=True):
+        self.id = uuid.uuid4().hex[:12]
+        self.wordbook = wordbook
+        self.pages = pages
+        self.priority = priority  # 값이 클수록 먼저 처리
+        self.use_cache = use_cache  # 같은 단어장/페이지 수의 이전 결과를 재사용할지 여부
+        self.status = JOB_QUEUED
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.output_path = None
+        self.rows = 0
+        self.cached = False  # 이전 작업 결과를 재사용했는지 여부
+        self.error = None
+        self.logs = []  # 최근 진행 로그 (최대 50줄)
+        self.cancel_event = threading.Event()
+
+    def log(self, message):
+        self.logs.append(message)
+        del self.logs[:-50]
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "wordbook": self.wordbook,
+            "pages": self.pages,
+            "priority": self.priority,
+            "status": self.status,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "rows": self.rows,
+            "cached": self.cached,
+            "error": self.error,
+            "logs": list(self.logs),
+        }
+
+
+class ExportDaemon:
+    """로그인된 크롤러(브라우저) 풀과 우선순위 작업 큐를 관리합니다."""
+
+    def __init__(self, output_dir, pool_size=1, main_url=DEFAULT_MAIN_URL, cache_ttl=3600, headless=False,
+                 dictionary_index=None, recycle_after_pages=None, memory_limit_mb=None,
+                 crawler_class=NaverWordbookCrawler):
+        self.output_dir = output_dir
+        self.main_url = main_url
+        self.cache_ttl = cache_ttl  # 같은 단어장/페이지 수 요청에 이전 결과를 재사용할 시간 (초), 지나면 작업과 파일도 삭제
+        self.jobs = {}
+        self.cache = {}  # (단어장 wbId, 페이지 수) -> 완료된 ExportJob
+        self.lock = threading.Lock()
+        self.job_queue = queue.PriorityQueue()
+        self.sequence = itertools.count()  # 같은 우선순위에서는 먼저 등록된 작업부터
+        self.stopping = threading.Event()
+        self.workers = []
+        self.crawlers = []
+        for idx in range(pool_size):
+            crawler = crawler_class(headless=headless, dictionary_index=dictionary_index, # 사전 색인은 읽기 전용이라 공유
+                                    recycle_after_pages=recycle_after_pages, memory_limit_mb=memory_limit_mb)
+            crawler.status_callback = self._make_status_callback(idx)
+            crawler.current_job = None  # 워커 스레드가 처리 중인 작업 (로그 전달용)
+            self.crawlers.append(crawler)
+        os.makedirs(self.output_dir, exist_ok=True)
+
+    def _make_status_callback(self, idx):
+        def callback(message):
+            crawler = self.crawlers[idx]
+            if crawler.current_job is not None:
+                crawler.current_job.log(message)
+            print(f"[브라우저 {idx + 1}] {message}")
+        return callback
+
+    def open_browsers(self):
+        """풀의 모든 브라우저를 띄우고 단어장 목록 페이지로 이동합니다. (이후 각 창에서 직접 로그인)"""
+        for crawler in self.crawlers:
+            crawler.setup_driver_and_navigate(self.main_url)
+
+    def warm_up(self):
+        """각 브라우저에서 단어장 목록을 미리 불러와 캐시합니다. 목록을 찾지 못한 브라우저 수를 반환합니다."""
+        failed = 0
+        for crawler in self.crawlers:
+            if not crawler.fetch_wordbook_list(refresh=True):
+                failed += 1
+        return failed
+
+    def start_workers(self):
+        for idx, crawler in enumerate(self.crawlers):
+            worker = threading.Thread(target=self._worker_loop, args=(crawler,), name=f"export-worker-{idx + 1}", daemon=True)
+            worker.start()
+            self.workers.append(worker)
+
+    def stop(self):
+        self.stopping.set()
+        for _ in self.workers:
+            self.job_queue.put((float("-inf"), next(self.sequence), None))  # 대기 중인 워커를 깨워 종료
+        for worker in self.workers:
+            worker.join(timeout=5)
+        for crawler in self.crawlers:
+            crawler.quit_driver()
+
+    def _find_wordbook_id(self, wordbook):
+        """
+        브라우저들이 불러둔 단어장 목록에서 이름(정확히 또는 정규화 후 일치)에 해당하는 wbId를 찾습니다. 없으면 None.
+        비슷한 이름의 다른 단어장 결과를 재사용하지 않도록 캐시는 이름 대신 wbId로 구분합니다.
+        """
+        target = normalize_wordbook_name(wordbook)
+        for crawler in self.crawlers:
+            wordbooks = dict(crawler.wordbook_cache)  # 워커가 목록을 다시 불러오는 중일 수 있으므로 복사본 사용
+            if wordbook in wordbooks:
+                return wordbooks[wordbook]['wbId']
+            for name, info in wordbooks.items():
+                if normalize_wordbook_name(name) == target:
+                    return info['wbId']
+        return None
+
+    def _reuse_cached_result(self, job, wbid):
+        """같은 단어장/페이지 수의 유효한 결과가 있으면 job을 완료 처리합니다. (self.lock을 잡은 상태에서 호출)"""
+        cached_job = self.cache.get((wbid, job.pages)) if wbid else None
+        if not cached_job or time.time() - cached_job.finished_at > self.cache_ttl \
+                or not os.path.exists(cached_job.output_path):
+            return False
+        job.status = JOB_DONE
+        job.cached = True
+        job.output_path = cached_job.output_path
+        job.rows = cached_job.rows
+        job.started_at = job.started_at or time.time()
+        job.finished_at = time.time()
+        job.log(f"작업 {cached_job.id}의 결과를 재사용합니다.")
+        return True
+
+    def _evict_expired_jobs(self):
+        """보관 시간이 지난 완료 작업과 그 결과 파일을 삭제합니다. (self.lock을 잡은 상태에서 호출)"""
+        expires_before = time.time() - max(self.cache_ttl, MIN_JOB_RETENTION)
+        expired = [job for job in self.jobs.values()
+                   if job.status in FINISHED_STATUSES and job.finished_at is not None and job.finished_at < expires_before]
+        for job in expired:
+            del self.jobs[job.id]
+            if job.output_path and not job.cached:  # 캐시를 재사용한 작업은 파일을 소유하지 않음
+                try:
+                    os.remove(job.output_path)
+                except OSError:
+                    pass
+        expired_ids = {job.id for job in expired}
+        for key in [key for key, cached_job in self.cache.items() if cached_job.id in expired_ids]:
+            del self.cache[key]
+
+    def submit(self, wordbook, pages, priority=0, use_cache=True):
+        """내보내기 작업을 등록합니다. 유효한 캐시가 있으면 즉시 완료된 작업을 반환합니다."""
+        job = ExportJob(wordbook, pages, priority, use_cache=use_cache)
+        wbid = self._find_wordbook_id(wordbook) if use_cache else None
+        with self.lock:
+            self._evict_expired_jobs()
+            if use_cache:
+                self._reuse_cached_result(job, wbid)
+            self.jobs[job.id] = job
+        if job.status == JOB_QUEUED:
+            self.job_queue.put((-priority, next(self.sequence), job))
+        return job
+
+    def get_job(self, job_id):
+        with self.lock:
+            return self.jobs.get(job_id)
+
+    def list_jobs(self):
+        with self.lock:
+            return sorted(self.jobs.values(), key=lambda job: job.created_at)
+
+    def cancel(self, job_id):
+        """대기 중인 작업은 바로 취소하고, 실행 중인 작업은 다음 페이지로 넘어가기 전에 중단시킵니다."""
+        job = self.get_job(job_id)
+        if job is None or job.status not in (JOB_QUEUED, JOB_RUNNING):
+            return False
+        job.cancel_event.set()
+        with self.lock:
+            if job.status == JOB_QUEUED:
+                job.status = JOB_CANCELLED
+                job.finished_at = time.time()
+        return True
+
+    def _ensure_browser(self, crawler):
+        """이전 작업 중 오류로 브라우저가 종료되었으면 다시 띄웁니다. (로그인이 풀렸을 수 있음)"""
+        if not crawler.driver:
+            crawler.setup_driver_and_navigate(self.main_url)
+
+    def _discard_dead_browser(self, crawler):
+        """작업 실패 후 브라우저가 응답하지 않으면 종료해 다음 작업에서 _ensure_browser가 새로 띄우도록 합니다."""
+        if not crawler.driver:
+            return
+        try:
+            crawler.driver.current_url
+        except Exception:
+            crawler.quit_driver()
+
+    def _worker_loop(self, crawler):
+        while not self.stopping.is_set():
+            _, _, job = self.job_queue.get()
+            if job is None:
+                break
+            with self.lock:
+                if job.status != JOB_QUEUED:  # 대기 중에 취소된 작업
+                    continue
+                job.status = JOB_RUNNING
+                job.started_at = time.time()
+
+            crawler.current_job = job
+            output_path = os.path.join(self.output_dir, f"{job.id}.csv")
+            try:
+                self._ensure_browser(crawler)
+                if not crawler.select_wordbook(job.wordbook):
+                    suggestion = crawler.suggest_wordbook_name(job.wordbook)
+                    hint = f" 비슷한 이름의 단어장: '{suggestion}'" if suggestion else ""
+                    raise Exception(f"'{job.wordbook}' 단어장을 찾거나 접근할 수 없습니다.{hint}")
+                wbid = crawler.selected_wordbook['wbId']
+                with self.lock:
+                    # 등록 시점에는 단어장 목록이 없어 확인하지 못한 캐시를 실제 선택한 단어장 기준으로 다시 확인
+                    if job.use_cache and self._reuse_cached_result(job, wbid):
+                        continue
+                rows = crawler.crawl_wordbook_pages(job.pages, output_path, stop_event=job.cancel_event)
+                with self.lock:
+                    job.finished_at = time.time()
+                    if job.cancel_event.is_set():
+                        job.status = JOB_CANCELLED
+                    elif not rows:
+                        job.status = JOB_FAILED
+                        job.error = "추출된 단어가 없습니다."
+                    else:
+                        job.status = JOB_DONE
+                        job.rows = rows
+                        job.output_path = output_path
+                        self.cache[(wbid, job.pages)] = job
+                    self._evict_expired_jobs()
+            except Exception as e:
+                with self.lock:
+                    job.status = JOB_FAILED
+                    job.error = str(e)
+                    job.finished_at = time.time()
+                self._discard_dead_browser(crawler)
+            finally:
+                crawler.current_job = None
+
+
+class ExportRequestHandler(BaseHTTPRequestHandler):
+    """
+    POST   /jobs              {"wordbook": "단어", "pages": 10, "priority": 0, "use_cache": true}
+    GET    /jobs              전체 작업 목록
+    GET    /jobs/<id>         작업 상태
+    GET    /jobs/<id>/result  완료된 작업의 CSV 파일
+    DELETE /jobs/<id>         작업 취소
+    """
+    daemon = None  # serve()에서 주입
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, payload, status=200):
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _path_parts(self):
+        return [part for part in urlparse(self.path).path.split("/") if part]
+
+    def do_POST(self):
+        if self._path_parts() != ["jobs"]:
+            self._send_json({"error": "not found"}, status=404)
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            body = json.loads(self.rfile.read(length) or b"{}")
+            if not isinstance(body["wordbook"], str):
+                raise TypeError("wordbook은 문자열이어야 합니다.")
+            wordbook = body["wordbook"].strip()
+            pages = int(body["pages"])
+            priority = int(body.get("priority", 0))
+            use_cache = bool(body.get("use_cache", True))
+            if not wordbook or pages <= 0:
+                raise ValueError("wordbook은 비어 있을 수 없고 pages는 1 이상이어야 합니다.")
+        except (KeyError, ValueError, TypeError) as e:
+            self._send_json({"error": f"잘못된 요청: {e}"}, status=400)
+            return
+        job = self.daemon.submit(wordbook, pages, priority=priority, use_cache=use_cache)
+        self._send_json(job.to_dict(), status=200 if job.cached else 202)
+
+    def do_GET(self):
+        parts = self._path_parts()
+        if parts == ["jobs"]:
+            self._send_json({"jobs": [job.to_dict() for job in self.daemon.list_jobs()]})
+            return
+        if len(parts) not in (2, 3) or parts[0] != "jobs" or (len(parts) == 3 and parts[2] != "result"):
+            self._send_json({"error": "not found"}, status=404)
+            return
+        job = self.daemon.get_job(parts[1])
+        if job is None:
+            self._send_json({"error": "작업을 찾을 수 없습니다."}, status=404)
+            return
+        if len(parts) == 2:
+            self._send_json(job.to_dict())
+            return
+        if job.status != JOB_DONE:
+            self._send_json({"error": f"작업이 완료되지 않았습니다. (상태: {job.status})"}, status=409)
+            return
+        try:
+            with open(job.output_path, "rb") as result_file:
+                data = result_file.read()
+        except OSError as e:
+            self._send_json({"error": f"결과 파일을 읽을 수 없습니다: {e}"}, status=410)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/csv; charset=utf-8")
+        self.send_header("Content-Disposition", f'attachment; filename="{job.id}.csv"')
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_DELETE(self):
+        parts = self._path_parts()
+        if len(parts) != 2 or parts[0] != "jobs":
+            self._send_json({"error": "not found"}, status=404)
+            return
+        if self.daemon.get_job(parts[1]) is None:
+            self._send_json({"error": "작업을 찾을 수 없습니다."}, status=404)
+            return
+        if not self.daemon.cancel(parts[1]):
+            self._send_json({"error": "이미 종료된 작업입니다."}, status=409)
+            return
+        self._send_json(self.daemon.get_job(parts[1]).to_dict())
+
+
+def serve(daemon, host="127.0.0.1", port=8766):
+    """작업 API 서버를 생성합니다. 외부 노출을 막기 위해 기본적으로 localhost에만 바인딩합니다."""
+    handler = type("BoundExportRequestHandler", (ExportRequestHandler,), {"daemon": daemon})
+    httpd = ThreadingHTTPServer((host, port), handler)
+    httpd.daemon_threads = True
+    return httpd
+
+
+def main():
+    parser = argparse.ArgumentParser(description="네이버 단어장 내보내기 데몬 (로그인된 브라우저 유지 + 작업 큐)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--pool-size", type=int, default=1, help="동시에 유지할 브라우저 수")
+    parser.add_argument("--output-dir", default=os.path.join(os.getcwd(), "exports"))
+    parser.add_argument("--cache-ttl", type=int, default=3600, help="완료된 결과 재사용 시간 (초, 0이면 재사용 안 함)")
+    parser.add_argument("--main-url", default=DEFAULT_MAIN_URL, help="단어장 목록 URL (모의 서버 테스트 시 변경)")
+    parser.add_argument("--headless", action="store_true", help="브라우저 창 없이 실행 (로그인이 필요 없는 모의 서버용)")
+    parser.add_argument("--backend", choices=("selenium", "cdp"), default="selenium",
+                        help="브라우저 제어 방식 (cdp: ChromeDriver 없이 DevTools Protocol로 직접 제어)")
+    parser.add_argument("--dictionary-dir", default=None, help="JLPT/빈도/다른 읽기 열을 추가할 사전 폴더")
+    parser.add_argument("--recycle-after-pages", type=int, default=None, help="이 페이지 수마다 브라우저 재시작")
+    parser.add_argument("--memory-limit-mb", type=int, default=1500, help="브라우저 메모리가 이 값을 넘으면 재시작")
+    args = parser.parse_args()
+
+    dictionary_index = DictionaryIndex.from_directory(args.dictionary_dir) if args.dictionary_dir else None
+    if args.backend == "cdp":
+        from cdp_backend import CdpWordbookCrawler
+        crawler_class = CdpWordbookCrawler
+    else:
+        crawler_class = NaverWordbookCrawler
+    daemon = ExportDaemon(args.output_dir, pool_size=args.pool_size, main_url=args.main_url,
+                          cache_ttl=args.cache_ttl, headless=args.headless, dictionary_index=dictionary_index,
+                          recycle_after_pages=args.recycle_after_pages, memory_limit_mb=args.memory_limit_mb,
+                          crawler_class=crawler_class)
+    try:
+        daemon.open_browsers()
+        if not args.headless:
+            input("열린 브라우저 창에서 모두 로그인한 뒤 Enter를 눌러주세요...")
+        failed = daemon.warm_up()
+        if failed:
+            print(f"경고: {failed}개 브라우저에서 단어장 목록을 불러오지 못했습니다. 해당 브라우저의 작업은 실패할 수 있습니다.")
+        daemon.start_workers()
+
+        httpd = serve(daemon, host=args.host, port=args.port)
+        print(f"내보내기 데몬 실행 중: http://{args.host}:{httpd.server_address[1]}/jobs")
+        try:
+            httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            httpd.server_close()
+    finally:
+        daemon.stop()
+
+
+if __name__ == '__main__':
+    main()
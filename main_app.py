@@ -4,14 +4,16 @@ import threading
 import os
 # from urllib.parse import quote # 현재 직접 사용하지 않으므로 주석 처리 또는 삭제
 from crawler_module import NaverWordbookCrawler
+from dictionary_index import DictionaryIndex
 
 class App:
     def __init__(self, root):
         self.root = root
         self.root.title("네이버 단어장 크롤러")
-        self.root.geometry("550x520")
+        self.root.geometry("550x560")
 
-        self.crawler = NaverWordbookCrawler(status_callback=self.update_status_thread_safe)
+        # 브라우저 메모리가 1.5GB를 넘으면 로그인 쿠키를 유지한 채 브라우저를 재시작 (긴 크롤링의 속도 저하/중단 방지)
+        self.crawler = NaverWordbookCrawler(status_callback=self.update_status_thread_safe, memory_limit_mb=1500)
         # 기본 설정값들
         self.default_wordbook_name_gui = "단어"
         self.wordbook_main_url = "https://learn.dict.naver.com/wordbook/jakodict/#/my/main" # 네이버 단어장 목록 메인 페이지
@@ -35,11 +37,13 @@ class App:
         self.step2_options_frame = ttk.LabelFrame(main_frame, text="크롤링 옵션", padding="10 10 10 10")
         # self.step2_options_frame은 open_main_page_for_login 성공 시 grid로 표시됨
 
-        # 대상 단어장 이름 입력 필드
+        # 대상 단어장 선택 필드 (목록에서 고르거나 직접 입력, 입력한 이름은 정확히 또는 전각/공백/대소문자 무시 후 일치해야 함)
         ttk.Label(self.step2_options_frame, text="대상 단어장 이름:").grid(row=0, column=0, padx=5, pady=5, sticky=tk.W)
         self.wordbook_name_var = tk.StringVar(value=self.default_wordbook_name_gui)
-        self.wordbook_name_entry = ttk.Entry(self.step2_options_frame, textvariable=self.wordbook_name_var, width=38)
-        self.wordbook_name_entry.grid(row=0, column=1, columnspan=2, padx=5, pady=5, sticky=tk.EW)
+        self.wordbook_name_combobox = ttk.Combobox(self.step2_options_frame, textvariable=self.wordbook_name_var, width=35)
+        self.wordbook_name_combobox.grid(row=0, column=1, padx=5, pady=5, sticky=tk.EW)
+        self.refresh_wordbooks_button = ttk.Button(self.step2_options_frame, text="목록 불러오기", command=self.refresh_wordbook_list, width=12)
+        self.refresh_wordbooks_button.grid(row=0, column=2, padx=5, pady=5)
 
         # 크롤링 할 페이지 수 입력 필드
         ttk.Label(self.step2_options_frame, text="크롤링 할 페이지 수:").grid(row=1, column=0, padx=5, pady=5, sticky=tk.W)
@@ -59,10 +63,19 @@ class App:
         self.save_folder_label.grid(row=3, column=1, padx=5, pady=5, sticky=tk.EW)
         self.select_folder_button = ttk.Button(self.step2_options_frame, text="폴더 선택...", command=self.select_save_folder, width=12)
         self.select_folder_button.grid(row=3, column=2, padx=5, pady=5)
-        
+
+        # 사전 폴더 선택 (선택 사항: JMdict/빈도/JLPT 파일이 있으면 CSV에 JLPT, 빈도 순위, 다른 읽기 열 추가)
+        ttk.Label(self.step2_options_frame, text="사전 폴더 (선택):").grid(row=4, column=0, padx=5, pady=5, sticky=tk.W)
+        self.dictionary_folder_var = tk.StringVar(value="")
+        self.dictionary_folder_label = ttk.Label(self.step2_options_frame, textvariable=self.dictionary_folder_var, relief="sunken", width=35, anchor=tk.W)
+        self.dictionary_folder_label.grid(row=4, column=1, padx=5, pady=5, sticky=tk.EW)
+        self.select_dictionary_button = ttk.Button(self.step2_options_frame, text="폴더 선택...", command=self.select_dictionary_folder, width=12)
+        self.select_dictionary_button.grid(row=4, column=2, padx=5, pady=5)
+        self.loaded_dictionary_folder = None # 이미 불러온 사전 색인의 폴더 (같은 폴더면 다시 불러오지 않음)
+
         # 크롤링 시작 버튼
         self.start_crawling_button = ttk.Button(self.step2_options_frame, text="2. 단어장 선택 및 크롤링 시작", command=self.select_wordbook_and_start_crawling, width=40)
-        self.start_crawling_button.grid(row=4, column=0, columnspan=3, pady=(10,0))
+        self.start_crawling_button.grid(row=5, column=0, columnspan=3, pady=(10,0))
         
         self.step2_options_frame.columnconfigure(1, weight=1) # 입력 필드들이 가로 공간을 차지하도록
 
@@ -85,6 +98,26 @@ class App:
         if folder_selected: # 사용자가 폴더를 선택했다면
             self.save_folder_var.set(folder_selected)
 
+    def select_dictionary_folder(self):
+        """사전 파일이 들어있는 폴더를 선택합니다. 취소하면 사전 정보 추가를 사용하지 않습니다."""
+        folder_selected = filedialog.askdirectory(initialdir=self.dictionary_folder_var.get() or os.getcwd())
+        self.dictionary_folder_var.set(folder_selected or "")
+
+    def _load_dictionary_index(self):
+        """선택된 사전 폴더의 색인을 크롤러에 연결합니다. (백그라운드 스레드에서 호출)"""
+        dictionary_folder = self.dictionary_folder_var.get()
+        if not dictionary_folder:
+            self.crawler.dictionary_index = None
+            self.loaded_dictionary_folder = None
+            return
+        if dictionary_folder == self.loaded_dictionary_folder:
+            return
+        index = DictionaryIndex.from_directory(dictionary_folder, status_callback=self.update_status_thread_safe)
+        if index is None:
+            self.update_status_thread_safe("사전 폴더에서 JMdict, 빈도 목록(freq*), JLPT 목록(jlpt*) 파일을 찾지 못해 사전 정보 없이 진행합니다.")
+        self.crawler.dictionary_index = index
+        self.loaded_dictionary_folder = dictionary_folder
+
     def update_status(self, message):
         """진행 상황 텍스트 영역에 메시지를 추가합니다. (GUI 스레드에서 직접 호출용)"""
         self.status_text.config(state=tk.NORMAL) # 편집 가능 상태로 변경
@@ -129,7 +162,7 @@ class App:
             self.crawler.setup_driver_and_navigate(self.wordbook_main_url)
             self.update_status(f"브라우저가 열렸습니다. URL: {self.wordbook_main_url}")
             self.update_status("단어장 목록 페이지에서 네이버 로그인 및 2단계 인증을 완료해주세요.")
-            self.update_status("완료 후 아래 옵션들을 입력하고 '2. 단어장 선택 및 크롤링 시작' 버튼을 눌러주세요.")
+            self.update_status("완료 후 '목록 불러오기'로 단어장을 선택하고 '2. 단어장 선택 및 크롤링 시작' 버튼을 눌러주세요.")
             
             # 2단계 UI 프레임 표시 및 내부 요소 활성화
             self.step2_options_frame.grid(row=1, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=10, padx=2)
@@ -143,11 +176,43 @@ class App:
             messagebox.showerror("오류", error_message)
             self._set_ui_interaction_state(False) # 오류 시 UI 다시 활성화 (1단계 버튼 포함)
 
+    def refresh_wordbook_list(self):
+        """로그인 후 단어장 목록을 불러와 단어장 선택 목록(Combobox)에 채웁니다."""
+        if not self.crawler.driver:
+            messagebox.showerror("오류", "브라우저가 열려있지 않습니다. '1. 단어장 목록 열기'를 먼저 실행해주세요.")
+            return
+
+        self._set_ui_interaction_state(True)
+        thread = threading.Thread(target=self.run_refresh_wordbook_list_logic, daemon=True)
+        thread.start()
+
+    def run_refresh_wordbook_list_logic(self):
+        """백그라운드 스레드에서 단어장 목록을 불러옵니다."""
+        try:
+            names = self.crawler.fetch_wordbook_list(refresh=True)
+            self.root.after(0, self._apply_wordbook_names, names)
+        except Exception as e:
+            error_message = f"단어장 목록 불러오기 실패: {e}"
+            self.update_status_thread_safe(error_message)
+            messagebox.showerror("오류", error_message)
+        finally:
+            self.root.after(0, lambda: self._set_ui_interaction_state(False))
+            self.root.after(0, lambda: self.open_browser_button.config(state=tk.DISABLED if self.crawler.driver else tk.NORMAL))
+
+    def _apply_wordbook_names(self, names):
+        """불러온 단어장 이름들을 선택 목록에 반영합니다. (GUI 스레드에서 호출)"""
+        if not names: # 목록을 불러오지 못한 경우 기존 선택 목록을 유지
+            return
+        self.wordbook_name_combobox.config(values=names)
+        # 현재 입력값과 일치하는 단어장이 있으면 그 이름으로 맞추고, 없으면 첫 번째 단어장을 선택
+        matched_name = self.crawler.find_wordbook_name(self.wordbook_name_var.get().strip())
+        self.wordbook_name_var.set(matched_name or names[0])
+
     def select_wordbook_and_start_crawling(self):
         """2단계: 사용자가 입력한 옵션을 바탕으로 특정 단어장을 선택하고 크롤링을 시작합니다."""
         wordbook_name_to_crawl = self.wordbook_name_var.get().strip()
         if not wordbook_name_to_crawl:
-            messagebox.showerror("입력 오류", "대상 단어장 이름을 입력해주세요.")
+            messagebox.showerror("입력 오류", "대상 단어장을 선택하거나 이름을 입력해주세요.")
             return
 
         num_pages_str = self.pages_entry.get()
@@ -194,8 +259,17 @@ class App:
     def run_select_and_crawl_logic(self, wordbook_name, num_pages, output_filepath):
         """백그라운드 스레드에서 실행될 실제 크롤링 로직입니다."""
         try:
+            self._load_dictionary_index()
             self.update_status_thread_safe(f"'{wordbook_name}' 단어장 선택 시도...")
-            if self.crawler.select_wordbook(wordbook_name): # 단어장 선택
+            matched_name = self.crawler.resolve_wordbook_name(wordbook_name)
+            if matched_name is None:
+                # 일치하는 단어장이 없으면 비슷한 이름을 자동으로 고르지 않고 사용자에게 확인
+                suggestion = self.crawler.suggest_wordbook_name(wordbook_name)
+                if suggestion and messagebox.askyesno("단어장 확인", f"'{wordbook_name}' 단어장이 없습니다.\n비슷한 이름의 '{suggestion}' 단어장을 크롤링할까요?"):
+                    matched_name = wordbook_name = suggestion
+                    self.root.after(0, self.wordbook_name_var.set, suggestion)
+            # 이미 찾은 이름으로 바로 이동 (select_wordbook은 목록을 다시 검색하며 불러오기를 반복할 수 있음)
+            if matched_name is not None and self.crawler.open_wordbook(matched_name): # 단어장 선택
                 self.update_status_thread_safe(f"'{wordbook_name}' 단어장 선택 완료. 크롤링을 시작합니다...")
                 # 단어장 페이지에서 단어 크롤링
                 self.crawler.crawl_wordbook_pages(
@@ -0,0 +1,204 @@
+import argparse
+import csv
+import glob
+import hashlib
+import heapq
+import itertools
+import json
+import os
+import re
+import tempfile
+import time
+import unicodedata
+
+# 여러 번 내보낸 단어장 CSV들을 하나로 합치는 도구.
+# 모든 행을 메모리에 올리지 않고, 일정 행 수씩 정렬한 임시 파일(run)을 만든 뒤 병합하는 외부 병합 정렬로 처리합니다.
+# 같은 단어(히라가나+한자)는 가장 최근 파일의 내용을 기준으로 하나만 남기고, 예문과 메모는 합칩니다.
+
+HIRAGANA_COLUMN = "히라가나"
+KANJI_COLUMN = "한자"
+EXAMPLE_COLUMN = "예문"
+MEMO_COLUMN = "메모"
+
+DEFAULT_CHUNK_ROWS = 100000 # 한 번에 메모리에서 정렬할 최대 행 수
+MAX_OPEN_RUNS = 256 # 한 번에 병합할 최대 임시 파일 수 (초과하면 여러 단계로 병합)
+
+
+def _normalize(text):
+    return re.sub(r'\s+', '', unicodedata.normalize('NFKC', text or ''))
+
+
+def card_key(hiragana, kanji):
+    """정규화한 히라가나/한자로 만든 카드 식별 해시."""
+    return hashlib.sha1(f"{_normalize(hiragana)}\t{_normalize(kanji)}".encode('utf-8')).hexdigest()[:16]
+
+
+def collect_input_files(paths, output_path=None):
+    """파일, 폴더(안의 *.csv), 와일드카드 패턴을 받아 입력 CSV 목록을 수정 시각 오래된 순으로 반환합니다."""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(glob.glob(os.path.join(path, '*.csv')))
+        elif any(ch in path for ch in '*?['):
+            files.extend(glob.glob(path))
+        else:
+            files.append(path)
+    output_abspath = os.path.abspath(output_path) if output_path else None
+    unique_files = {os.path.abspath(f) for f in files} - {output_abspath}
+    return sorted(unique_files, key=lambda f: (os.path.getmtime(f), f))
+
+
+def _read_rows(filepath):
+    with open(filepath, 'r', newline='', encoding='utf-8-sig') as csvfile:
+        reader = csv.DictReader(csvfile)
+        for row in reader:
+            yield {key: value or '' for key, value in row.items() if key is not None}
+
+
+def _write_run(records, run_dir, run_no):
+    """정렬된 레코드들을 JSON Lines 임시 파일로 씁니다."""
+    records.sort(key=lambda record: record[:4])
+    run_path = os.path.join(run_dir, f"run_{run_no:06d}.jsonl")
+    with open(run_path, 'w', encoding='utf-8') as run_file:
+        for record in records:
+            run_file.write(json.dumps(record, ensure_ascii=False))
+            run_file.write('\n')
+    return run_path
+
+
+def _read_run(run_path):
+    with open(run_path, 'r', encoding='utf-8') as run_file:
+        for line in run_file:
+            yield json.loads(line)
+
+
+def _merge_runs(run_paths):
+    """정렬된 임시 파일들을 하나의 정렬된 레코드 스트림으로 병합합니다."""
+    return heapq.merge(*(_read_run(path) for path in run_paths), key=lambda record: record[:4])
+
+
+def _reduce_run_count(run_paths, run_dir, next_run_no):
+    """임시 파일이 너무 많으면 MAX_OPEN_RUNS개씩 미리 병합해 파일 수를 줄입니다."""
+    while len(run_paths) > MAX_OPEN_RUNS:
+        merged_paths = []
+        for start in range(0, len(run_paths), MAX_OPEN_RUNS):
+            group = run_paths[start:start + MAX_OPEN_RUNS]
+            run_path = os.path.join(run_dir, f"run_{next_run_no:06d}.jsonl")
+            next_run_no += 1
+            with open(run_path, 'w', encoding='utf-8') as run_file:
+                for record in _merge_runs(group):
+                    run_file.write(json.dumps(record, ensure_ascii=False))
+                    run_file.write('\n')
+            for path in group:
+                os.remove(path)
+            merged_paths.append(run_path)
+        run_paths = merged_paths
+    return run_paths
+
+
+def _merge_blocks(values, separator):
+    """여러 버전의 예문/메모를 구분자 단위로 나눠 중복 없이 합칩니다. (최신 버전의 순서 우선)"""
+    seen = []
+    for value in values:
+        for block in value.split(separator):
+            block = block.strip()
+            if block and block not in seen:
+                seen.append(block)
+    return separator.join(seen)
+
+
+def merge_card_versions(rows):
+    """
+    같은 카드의 여러 버전(최신 순)을 하나로 합칩니다.
+    최신 버전의 값을 사용하되 비어 있는 열은 이전 버전으로 채우고, 예문과 메모는 모든 버전을 합칩니다.
+    """
+    merged = dict(rows[0])
+    for older in rows[1:]:
+        for column, value in older.items():
+            if not merged.get(column) and value:
+                merged[column] = value
+    if len(rows) > 1:
+        merged[EXAMPLE_COLUMN] = _merge_blocks([row.get(EXAMPLE_COLUMN, '') for row in rows], "\n\n")
+        merged[MEMO_COLUMN] = _merge_blocks([row.get(MEMO_COLUMN, '') for row in rows], "\n")
+    return merged
+
+
+def merge_exports(input_files, output_path, chunk_rows=DEFAULT_CHUNK_ROWS, status_callback=print):
+    """
+    입력 CSV들을 중복 제거 후 (히라가나, 한자) 순으로 정렬하여 output_path에 저장하고 통계를 반환합니다.
+    """
+    started = time.perf_counter()
+    headers = [] # 모든 입력 파일의 열을 처음 나온 순서대로 합친 목록
+    rows_read = 0
+
+    with tempfile.TemporaryDirectory(prefix="wordbook-merge-") as run_dir:
+        run_paths = []
+        records = []
+        # 1단계: 입력을 chunk_rows행씩 읽어 정렬된 임시 파일로 저장
+        # 레코드 = [정렬용 히라가나, 정렬용 한자, 카드 키, 최신 순서(작을수록 최신), 행]
+        for file_rank, filepath in enumerate(reversed(input_files)):
+            file_rows = 0
+            for row in _read_rows(filepath):
+                for column in row:
+                    if column not in headers:
+                        headers.append(column)
+                hiragana, kanji = row.get(HIRAGANA_COLUMN, ''), row.get(KANJI_COLUMN, '')
+                if not hiragana and not kanji:
+                    continue # 단어가 없는 행은 건너뜀
+                records.append([_normalize(hiragana), _normalize(kanji), card_key(hiragana, kanji), file_rank, row])
+                rows_read += 1
+                file_rows += 1
+                if len(records) >= chunk_rows:
+                    run_paths.append(_write_run(records, run_dir, len(run_paths)))
+                    records = []
+            status_callback(f"읽음: {filepath} ({file_rows}행)")
+        if records:
+            run_paths.append(_write_run(records, run_dir, len(run_paths)))
+            records = []
+        run_count = len(run_paths)
+        run_paths = _reduce_run_count(run_paths, run_dir, len(run_paths))
+
+        # 2단계: 임시 파일들을 병합하면서 같은 카드 키의 연속된 행을 하나로 합쳐 저장
+        unique_rows = 0
+        with open(output_path, 'w', newline='', encoding='utf-8-sig') as csvfile: # utf-8-sig로 Excel 호환성 높임
+            writer = csv.DictWriter(csvfile, fieldnames=headers, restval='')
+            writer.writeheader()
+            for _, group in itertools.groupby(_merge_runs(run_paths), key=lambda record: record[2]):
+                writer.writerow(merge_card_versions([record[4] for record in group]))
+                unique_rows += 1
+
+    elapsed = time.perf_counter() - started
+    duplicates = rows_read - unique_rows
+    return {
+        "files": len(input_files),
+        "rows_read": rows_read,
+        "unique_rows": unique_rows,
+        "duplicates": duplicates,
+        "duplicate_rate": duplicates / rows_read if rows_read else 0.0,
+        "runs": run_count,
+        "seconds": elapsed,
+        "rows_per_second": rows_read / elapsed if elapsed else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="내보낸 단어장 CSV들을 중복 제거 및 정렬하여 하나로 합칩니다.")
+    parser.add_argument("output", help="결과 CSV 파일 경로")
+    parser.add_argument("inputs", nargs="+", help="입력 CSV 파일, 폴더 또는 와일드카드 패턴")
+    parser.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS,
+                        help=f"메모리에서 한 번에 정렬할 최대 행 수 (기본 {DEFAULT_CHUNK_ROWS})")
+    args = parser.parse_args()
+
+    input_files = collect_input_files(args.inputs, output_path=args.output)
+    if not input_files:
+        parser.error("입력 CSV 파일을 찾을 수 없습니다.")
+
+    stats = merge_exports(input_files, args.output, chunk_rows=args.chunk_rows)
+    print(f"저장 완료: {args.output}")
+    print(f"입력 {stats['files']}개 파일, {stats['rows_read']}행 → 고유 단어 {stats['unique_rows']}개 "
+          f"(중복 {stats['duplicates']}행, {stats['duplicate_rate'] * 100:.1f}%)")
+    print(f"정렬 임시 파일 {stats['runs']}개, {stats['seconds']:.2f}초, {stats['rows_per_second']:.0f}행/초")
+
+
+if __name__ == '__main__':
+    main()
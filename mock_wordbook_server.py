@@ -0,0 +1,364 @@
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+# 네이버 단어장(learn.dict.naver.com/wordbook/jakodict/)을 흉내 내는 로컬 테스트 서버.
+# NaverWordbookCrawler가 의존하는 DOM 구조(#wrap, #main_folder, #section_word_card, #page_area 등)만 재현합니다.
+
+WORDBOOK_PATH = "/wordbook/jakodict/"
+
+# 더미 단어 생성에 사용할 재료 (카드 번호에 따라 결정적으로 조합됨)
+SAMPLE_WORDS = [
+    ("たべる", "食べる", "동사", "먹다"),
+    ("のむ", "飲む", "동사", "마시다"),
+    ("がっこう", "学校", "명사", "학교"),
+    ("あたらしい", "新しい", "형용사", "새롭다"),
+    ("しずか", "静か", "형용동사", "조용함"),
+    ("ゆっくり", "", "부사", "천천히"),
+    ("べんきょう", "勉強", "명사", "공부"),
+    ("はやい", "早い", "형용사", "이르다"),
+]
+
+INDEX_HTML = """<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<title>Mock Naver Wordbook</title>
+<style>
+  .wrap_memo { display: block; }
+  #page_list { list-style: none; display: flex; gap: 4px; padding: 0; }
+  .page_num.is-active { font-weight: bold; }
+</style>
+</head>
+<body>
+<div id="wrap">
+  <div id="main_folder" style="display: none;"><ul class="list_folder"></ul></div>
+  <div id="section_word_card" style="display: none;"></div>
+  <div id="page_area" style="display: none;"><ul id="page_list"></ul></div>
+</div>
+<script>
+(function () {
+  var requestSeq = 0; // 늦게 도착한 이전 요청 응답은 무시
+  var lastTotalPages = 0; // 카드 API 실패 시에도 페이지네이션은 유지
+
+  function escapeHtml(text) {
+    return String(text).replace(/[&<>"']/g, function (c) {
+      return {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#39;"}[c];
+    });
+  }
+
+  function parseHash() {
+    var hash = window.location.hash.replace(/^#/, "");
+    var parts = hash.split("?");
+    var params = {};
+    (parts[1] || "").split("&").forEach(function (pair) {
+      if (!pair) return;
+      var kv = pair.split("=");
+      params[decodeURIComponent(kv[0])] = decodeURIComponent(kv[1] || "");
+    });
+    return {path: parts[0] || "/my/main", params: params};
+  }
+
+  function hide(id) { document.getElementById(id).style.display = "none"; }
+  function show(id) { document.getElementById(id).style.display = "block"; }
+
+  function renderFolders(folders) {
+    var html = folders.map(function (f) {
+      return '<li class="item_folder _item_folder">' +
+        '<a href="#/my/cards?wbId=' + encodeURIComponent(f.wbId) + '&qt=0&st=0&name=' +
+        encodeURIComponent(f.name) + '&tab=list" class="folder_inner _btn_cards_link">' +
+        '<div class="folder_tit"><span class="name">' + escapeHtml(f.name) + '</span></div>' +
+        '<span class="count">' + f.count + '</span></a></li>';
+    }).join("");
+    document.querySelector("#main_folder ul.list_folder").innerHTML = html;
+    show("main_folder");
+  }
+
+  function renderCard(card) {
+    var title = card.kanji ? card.hiragana + " [" + card.kanji + "]" : card.hiragana;
+    var means = card.meanings.map(function (m) {
+      var examples = m.examples.map(function (ex) {
+        return '<li class="item_example"><p class="origin">' + escapeHtml(ex[0]) + '</p>' +
+          '<p class="translate">' + escapeHtml(ex[1]) + '</p></li>';
+      }).join("");
+      return '<li class="item_mean"><div class="mean_desc"><p class="cont">' +
+        '<em class="part_speech">' + escapeHtml(m.pos) + '</em>' + escapeHtml(m.text) + '</p></div>' +
+        (examples ? '<ul class="example">' + examples + '</ul>' : '') + '</li>';
+    }).join("");
+    var memo = card.memo ?
+      '<div class="wrap_memo view"><div class="_temp_memo">' + escapeHtml(card.memo) + '</div>' +
+      '<textarea class="_memo_area">' + escapeHtml(card.memo) + '</textarea></div>' :
+      '<div class="wrap_memo" style="display: none;"><div class="_temp_memo"></div></div>';
+    return '<div class="card_item"><div class="inner_card">' +
+      '<div class="item_word"><a href="#" class="title">' + escapeHtml(title) + '</a></div>' +
+      '<div class="wrap_mean"><ul class="list_mean">' + means + '</ul></div>' + memo + '</div></div>';
+  }
+
+  function renderPagination(page, totalPages) {
+    // 실제 사이트처럼 현재 페이지 주변의 번호 버튼만 노출 (1만 페이지 이상에서도 DOM 크기 일정)
+    var start = Math.max(1, page - 4);
+    var end = Math.min(totalPages, start + 9);
+    var html = "";
+    for (var p = start; p <= end; p++) {
+      html += '<li><button type="button" class="page_num' + (p === page ? ' is-active' : '') +
+        '" data-page="' + p + '">' + p + '</button></li>';
+    }
+    var list = document.getElementById("page_list");
+    list.innerHTML = html;
+    list.onclick = function (ev) {
+      var target = ev.target;
+      if (!target.classList.contains("page_num")) return;
+      var params = parseHash().params;
+      params.page = target.getAttribute("data-page");
+      window.location.hash = "#/my/cards?" + Object.keys(params).map(function (k) {
+        return encodeURIComponent(k) + "=" + encodeURIComponent(params[k]);
+      }).join("&");
+    };
+    show("page_area");
+  }
+
+  function route() {
+    var seq = ++requestSeq;
+    var route = parseHash();
+    if (route.path === "/my/cards") {
+      hide("main_folder");
+      var page = parseInt(route.params.page || "1", 10);
+      fetch("/api/cards?wbId=" + encodeURIComponent(route.params.wbId || "") + "&page=" + page)
+        .then(function (res) { return res.ok ? res.json() : {cards: [], page: page, totalPages: lastTotalPages}; })
+        .catch(function () { return {cards: [], page: page, totalPages: lastTotalPages}; })
+        .then(function (data) {
+          if (seq !== requestSeq) return;
+          lastTotalPages = data.totalPages;
+          var section = document.getElementById("section_word_card");
+          section.innerHTML = data.cards.map(renderCard).join("");
+          show("section_word_card");
+          renderPagination(data.page, data.totalPages);
+        });
+    } else {
+      hide("section_word_card");
+      hide("page_area");
+      fetch("/api/folders")
+        .then(function (res) { return res.ok ? res.json() : {folders: []}; })
+        .catch(function () { return {folders: []}; })
+        .then(function (data) {
+          if (seq !== requestSeq) return;
+          renderFolders(data.folders);
+        });
+    }
+  }
+
+  window.addEventListener("hashchange", route);
+  route();
+})();
+</script>
+</body>
+</html>
+"""
+
+
+class MockWordbookConfig:
+    """모의 서버의 동작(단어장 구성, 지연 시간, 장애 주입)을 정의합니다."""
+
+    def __init__(self, wordbooks=None, cards_per_page=20, latency_ms=0, jitter_ms=0,
+                 fail_rate=0.0, seed=None):
+        # wordbooks: {단어장 이름: 카드 수} 형태. 지정하지 않으면 기본 단어장 하나를 만듦
+        self.wordbooks = wordbooks or {"단어": 200}
+        self.cards_per_page = cards_per_page
+        self.latency_ms = latency_ms  # API 응답마다 추가되는 기본 지연 시간
+        self.jitter_ms = jitter_ms    # 기본 지연 시간에 더해지는 무작위 지연 시간의 최대값
+        self.fail_rate = fail_rate    # 카드 API가 HTTP 500을 반환할 확률 (0.0 ~ 1.0)
+        self.random = random.Random(seed)
+        self.random_lock = threading.Lock()
+
+    def wordbook_id(self, index):
+        """단어장 순번으로 실제 사이트와 비슷한 32자리 wbId를 만듭니다."""
+        return f"{index:032x}"
+
+    def folders(self):
+        return [
+            {"wbId": self.wordbook_id(idx), "name": name, "count": count}
+            for idx, (name, count) in enumerate(self.wordbooks.items())
+        ]
+
+    def card_count(self, wb_id):
+        for folder in self.folders():
+            if folder["wbId"] == wb_id:
+                return folder["count"]
+        return 0
+
+    def total_pages(self, wb_id):
+        return -(-self.card_count(wb_id) // self.cards_per_page)  # 올림 나눗셈
+
+    def make_card(self, card_no):
+        """카드 번호로부터 항상 같은 내용의 더미 단어 카드를 생성합니다."""
+        hiragana, kanji, pos, meaning = SAMPLE_WORDS[card_no % len(SAMPLE_WORDS)]
+        suffix = str(card_no)  # 카드마다 고유한 단어가 되도록 번호를 붙임
+        meanings = [{
+            "pos": pos,
+            "text": f"{meaning} ({suffix})",
+            "examples": [[f"{kanji or hiragana}の例文{suffix}。", f"{meaning} 예문 {suffix}."]],
+        }]
+        if card_no % 3 == 0:  # 일부 카드는 뜻이 두 개
+            meanings.append({"pos": pos, "text": f"{meaning}의 다른 뜻 ({suffix})", "examples": []})
+        return {
+            "hiragana": hiragana + suffix,
+            "kanji": kanji + suffix if kanji else "",
+            "meanings": meanings,
+            "memo": f"메모 {suffix}" if card_no % 5 == 0 else "",
+        }
+
+    def cards_for_page(self, wb_id, page):
+        start = (page - 1) * self.cards_per_page
+        end = min(start + self.cards_per_page, self.card_count(wb_id))
+        return [self.make_card(card_no) for card_no in range(start, max(start, end))]
+
+    def delay(self):
+        """설정된 지연 시간만큼 응답을 늦춥니다."""
+        with self.random_lock:
+            jitter = self.random.uniform(0, self.jitter_ms) if self.jitter_ms else 0
+        total_ms = self.latency_ms + jitter
+        if total_ms > 0:
+            time.sleep(total_ms / 1000.0)
+
+    def should_fail(self):
+        if self.fail_rate <= 0:
+            return False
+        with self.random_lock:
+            return self.random.random() < self.fail_rate
+
+
+class MockWordbookRequestHandler(BaseHTTPRequestHandler):
+    config = None  # MockWordbookServer가 서버별로 주입
+
+    def log_message(self, format, *args):
+        pass  # 벤치마크 중 콘솔 출력 억제
+
+    def _send(self, status, body, content_type):
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_json(self, payload, status=200):
+        self._send(status, json.dumps(payload, ensure_ascii=False), "application/json; charset=utf-8")
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        params = parse_qs(parsed.query)
+
+        if parsed.path in ("/", WORDBOOK_PATH.rstrip("/"), WORDBOOK_PATH):
+            self._send(200, INDEX_HTML, "text/html; charset=utf-8")
+        elif parsed.path == "/api/folders":
+            self.config.delay()
+            self._send_json({"folders": self.config.folders()})
+        elif parsed.path == "/api/cards":
+            self.config.delay()
+            if self.config.should_fail():
+                self._send_json({"error": "injected failure"}, status=500)
+                return
+            wb_id = params.get("wbId", [""])[0]
+            try:
+                page = max(1, int(params.get("page", ["1"])[0]))
+            except ValueError:
+                page = 1
+            self._send_json({
+                "page": page,
+                "totalPages": self.config.total_pages(wb_id),
+                "cards": self.config.cards_for_page(wb_id, page),
+            })
+        else:
+            self._send_json({"error": "not found"}, status=404)
+
+
+class MockWordbookServer:
+    """백그라운드 스레드에서 모의 단어장 서버를 실행합니다."""
+
+    def __init__(self, config=None, host="127.0.0.1", port=0):
+        self.config = config or MockWordbookConfig()
+        handler = type("BoundMockWordbookRequestHandler", (MockWordbookRequestHandler,), {"config": self.config})
+        self.httpd = ThreadingHTTPServer((host, port), handler)  # port=0이면 빈 포트 자동 할당
+        self.httpd.daemon_threads = True
+        self.thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}{WORDBOOK_PATH}"
+
+    @property
+    def main_url(self):
+        """App.wordbook_main_url 대신 사용할 단어장 목록 페이지 URL."""
+        return self.base_url + "#/my/main"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self.thread:
+            self.thread.join()
+            self.thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+def parse_wordbook_specs(specs):
+    """'이름=카드수' 형식의 문자열 목록을 {이름: 카드수} 딕셔너리로 변환합니다."""
+    wordbooks = {}
+    for spec in specs:
+        name, sep, count = spec.rpartition("=")
+        if not sep or not name:
+            raise argparse.ArgumentTypeError(f"단어장 지정 형식이 잘못되었습니다: {spec} (예: 단어=200)")
+        wordbooks[name] = int(count)
+    return wordbooks
+
+
+def main():
+    parser = argparse.ArgumentParser(description="네이버 단어장 모의 서버 (크롤러 테스트 및 벤치마크용)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--wordbook", action="append", default=[], metavar="이름=카드수",
+                        help="생성할 단어장 (여러 번 지정 가능, 기본값: 단어=200)")
+    parser.add_argument("--cards-per-page", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=0, help="API 응답 기본 지연 시간 (ms)")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="추가 무작위 지연 시간 최대값 (ms)")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="카드 API 실패 확률 (0.0 ~ 1.0)")
+    parser.add_argument("--seed", type=int, default=None, help="지연/실패 난수 시드")
+    args = parser.parse_args()
+
+    config = MockWordbookConfig(
+        wordbooks=parse_wordbook_specs(args.wordbook) or None,
+        cards_per_page=args.cards_per_page,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        fail_rate=args.fail_rate,
+        seed=args.seed,
+    )
+    server = MockWordbookServer(config, host=args.host, port=args.port)
+    print(f"모의 단어장 서버 실행 중: {server.main_url}")
+    for folder in config.folders():
+        print(f"  - {folder['name']}: 카드 {folder['count']}개, {config.total_pages(folder['wbId'])} 페이지")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+import pytest
+
+pytest.importorskip("selenium")
+pytest.importorskip("bs4")
+
+from crawler_module import NaverWordbookCrawler, normalize_wordbook_name
+
+
+def make_crawler(names):
+    crawler = NaverWordbookCrawler(status_callback=lambda message: None)
+    crawler.wordbook_cache = {name: {'wbId': f"wb{idx}", 'url': ''} for idx, name in enumerate(names)}
+    return crawler
+
+
+def test_normalize_wordbook_name():
+    assert normalize_wordbook_name("ＪＬＰＴ　N2 ") == "jlptn2"
+    assert normalize_wordbook_name("단어 장") == normalize_wordbook_name("단어장")
+
+
+def test_find_wordbook_name_exact_and_normalized():
+    crawler = make_crawler(["단어", "JLPT N2", "JLPT N3"])
+    assert crawler.find_wordbook_name("단어") == "단어"
+    assert crawler.find_wordbook_name("ｊｌｐｔ n3") == "JLPT N3"
+
+
+def test_find_wordbook_name_does_not_guess():
+    crawler = make_crawler(["JLPT N2"])
+    assert crawler.find_wordbook_name("JLPT N3") is None
+    assert crawler.suggest_wordbook_name("JLPT N3") == "JLPT N2"  # 비슷한 이름은 안내용으로만
+
+
+CARD_HTML = """
+<div id="section_word_card">
+  <div class="card_item"><div class="inner_card">
+    <div class="item_word"><a href="#" class="title">たべる [食べる]</a></div>
+    <div class="wrap_mean"><ul class="list_mean">
+      <li class="item_mean"><div class="mean_desc"><p class="cont"><em class="part_speech">동사</em>먹다</p></div>
+        <ul class="example"><li class="item_example"><p class="origin">ご飯を食べる。</p><p class="translate">밥을 먹다.</p></li></ul>
+      </li>
+      <li class="item_mean"><div class="mean_desc"><p class="cont"><em class="part_speech">동사</em>생활하다</p></div></li>
+    </ul></div>
+    <div class="wrap_memo view"><div class="_temp_memo">자주 틀림</div><textarea class="_memo_area">자주 틀림</textarea></div>
+  </div></div>
+  <div class="card_item"><div class="inner_card">
+    <div class="item_word"><a href="#" class="title">ゆっくり</a></div>
+    <div class="wrap_mean"><ul class="list_mean">
+      <li class="item_mean"><div class="mean_desc"><p class="cont"><em class="part_speech">부사</em>천천히</p></div></li>
+    </ul></div>
+    <div class="wrap_memo" style="display: none;"><div class="_temp_memo"></div></div>
+  </div></div>
+</div>
+"""
+
+
+def test_parse_word_cards():
+    rows = make_crawler([])._parse_word_cards(CARD_HTML)
+    assert rows == [
+        ["たべる", "食べる", "동사", "먹다\n생활하다", "ご飯を食べる。\n밥을 먹다.", "자주 틀림"],
+        ["ゆっくり", "ゆっくり", "부사", "천천히", "", ""],
+    ]
+
+
+def test_parse_word_cards_without_section():
+    assert make_crawler([])._parse_word_cards("<div></div>") == []
+
+
+def test_memory_checked_every_interval():
+    crawler = NaverWordbookCrawler(status_callback=lambda message: None, memory_limit_mb=1000)
+    crawler.memory_check_interval = 3
+    checked_pages = []
+
+    def fake_memory_mb():
+        checked_pages.append(crawler.pages_since_recycle)
+        return 1500 if crawler.pages_since_recycle >= 9 else 500
+
+    crawler._browser_memory_mb = fake_memory_mb
+    results = []
+    for page in range(1, 10):
+        crawler.pages_since_recycle = page
+        results.append(crawler._should_recycle_browser())
+    assert checked_pages == [3, 6, 9]
+    assert results == [False] * 8 + [True]
+
+
+def test_memory_check_disabled_when_unmeasurable():
+    messages = []
+    crawler = NaverWordbookCrawler(status_callback=messages.append, memory_limit_mb=1000)
+    crawler.memory_check_interval = 2
+    checked_pages = []
+    crawler._browser_memory_mb = lambda: checked_pages.append(crawler.pages_since_recycle)  # 항상 None
+    for page in range(1, 9):
+        crawler.pages_since_recycle = page
+        assert not crawler._should_recycle_browser()
+    assert checked_pages == [2]  # 한 번 측정에 실패하면 이후로는 측정하지 않음
+    assert not crawler.memory_check_available
+    assert sum("psutil" in message for message in messages) == 1
+
+
+def test_recycle_after_pages():
+    crawler = NaverWordbookCrawler(status_callback=lambda message: None, recycle_after_pages=4)
+    crawler.pages_since_recycle = 3
+    assert not crawler._should_recycle_browser()
+    crawler.pages_since_recycle = 4
+    assert crawler._should_recycle_browser()
@@ -0,0 +1,76 @@
+from dictionary_index import DictionaryIndex
+
+JMDICT_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<JMdict>
+<entry>
+<k_ele><keb>上手</keb><ke_pri>nf05</ke_pri></k_ele>
+<r_ele><reb>じょうず</reb></r_ele>
+<r_ele><reb>うわて</reb></r_ele>
+</entry>
+<entry>
+<k_ele><keb>食べる</keb></k_ele>
+<r_ele><reb>たべる</reb></r_ele>
+</entry>
+<entry>
+<r_ele><reb>ゆっくり</reb><re_pri>nf10</re_pri></r_ele>
+</entry>
+<entry>
+<k_ele><keb>紙</keb><ke_pri>nf02</ke_pri></k_ele>
+<r_ele><reb>かみ</reb></r_ele>
+</entry>
+<entry>
+<k_ele><keb>神</keb></k_ele>
+<r_ele><reb>かみ</reb></r_ele>
+</entry>
+<entry>
+<k_ele><keb>髪</keb></k_ele>
+<r_ele><reb>かみ</reb></r_ele>
+</entry>
+</JMdict>
+"""
+
+
+def write_sources(folder):
+    (folder / "JMdict_e").write_text(JMDICT_XML, encoding="utf-8")
+    (folder / "freq.tsv").write_text("食べる\t120\nかみ\t50\n神\t3000\n", encoding="utf-8")
+    (folder / "jlpt.csv").write_text("단어,읽기,급수\n食べる,たべる,N5\n上手,じょうず,N4\n", encoding="utf-8")
+
+
+def test_build_and_lookup(tmp_path):
+    write_sources(tmp_path)
+    index = DictionaryIndex.build(str(tmp_path / "JMdict_e"), str(tmp_path / "freq.tsv"), str(tmp_path / "jlpt.csv"))
+    assert index.lookup("食べる", "たべる") == ("N5", "120", "")
+    assert index.lookup("上手", "じょうず") == ("N4", "2500", "うわて")
+    assert index.lookup("上手", "うわて")[2] == "じょうず"
+    assert index.lookup("ゆっくり", "ゆっくり") == ("", "5000", "")
+    assert index.lookup("ＡＢＣ", "えーびーしー") == DictionaryIndex.EMPTY_RECORD
+
+
+def test_homophones_use_their_own_rank(tmp_path):
+    write_sources(tmp_path)
+    index = DictionaryIndex.build(str(tmp_path / "JMdict_e"), str(tmp_path / "freq.tsv"), str(tmp_path / "jlpt.csv"))
+    # 읽기(かみ)의 순위를 한자 표기가 있는 단어들에 나눠 주지 않음
+    assert index.lookup("神", "かみ")[1] == "3000"
+    assert index.lookup("紙", "かみ")[1] == "1000"  # 빈도 목록에 없으면 JMdict 빈도 표시 사용
+    assert index.lookup("髪", "かみ")[1] == ""
+
+
+def test_lookup_multiple_surfaces_and_annotate_row(tmp_path):
+    write_sources(tmp_path)
+    index = DictionaryIndex.build(str(tmp_path / "JMdict_e"), str(tmp_path / "freq.tsv"), str(tmp_path / "jlpt.csv"))
+    assert index.lookup("喰べる・食べる", "たべる")[0] == "N5"
+    assert index.annotate_row(["たべる", "食べる", "동사"]) == ["たべる", "食べる", "동사", "N5", "120", ""]
+
+
+def test_from_directory_uses_cache(tmp_path):
+    write_sources(tmp_path)
+    messages = []
+    built = DictionaryIndex.from_directory(str(tmp_path), status_callback=messages.append)
+    loaded = DictionaryIndex.from_directory(str(tmp_path), status_callback=messages.append)
+    assert "캐시를 불러왔습니다" in messages[-1]
+    assert loaded.by_pair == built.by_pair
+    assert loaded.by_surface == built.by_surface
+
+
+def test_from_directory_without_sources(tmp_path):
+    assert DictionaryIndex.from_directory(str(tmp_path)) is None
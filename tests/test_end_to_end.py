@@ -0,0 +1,99 @@
+import csv
+import os
+import shutil
+
+import pytest
+
+pytest.importorskip("selenium")
+pytest.importorskip("bs4")
+
+from crawler_module import CSV_HEADERS, NaverWordbookCrawler
+from mock_wordbook_server import MockWordbookConfig, MockWordbookServer
+
+CHROME_NAMES = ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome")
+
+pytestmark = pytest.mark.skipif(
+    not (os.environ.get("CHROME_BINARY") or any(shutil.which(name) for name in CHROME_NAMES)),
+    reason="Chrome이 설치되어 있지 않음",
+)
+
+
+def crawl_mock_wordbook(tmp_path, crawler_class):
+    """모의 서버의 50개 카드(3페이지)를 크롤링하고 결과 CSV를 확인합니다."""
+    config = MockWordbookConfig(wordbooks={"단어": 50, "JLPT N2": 5}, cards_per_page=20, seed=0)
+    output_path = str(tmp_path / "out.csv")
+    crawler = crawler_class(status_callback=lambda message: None, headless=True)
+    crawler.card_settle_delay = crawler.scroll_settle_delay = crawler.page_settle_delay = 0
+    with MockWordbookServer(config) as server:
+        try:
+            crawler.setup_driver_and_navigate(server.main_url)
+            assert crawler.fetch_wordbook_list(refresh=True) == ["단어", "JLPT N2"]
+            assert crawler.select_wordbook("단어")
+            assert crawler.crawl_wordbook_pages(3, output_path) == 50
+            # 크롤링 후에도 단어장 목록을 다시 불러올 수 있어야 함
+            assert crawler.fetch_wordbook_list(refresh=True) == ["단어", "JLPT N2"]
+        finally:
+            crawler.quit_driver()
+
+    with open(output_path, 'r', newline='', encoding='utf-8-sig') as csvfile:
+        rows = list(csv.reader(csvfile))
+    assert rows[0] == CSV_HEADERS
+    first_card = config.make_card(0)
+    assert rows[1][:2] == [first_card["hiragana"], first_card["kanji"]]
+    assert len(rows) == 51
+
+
+def test_crawl_mock_wordbook(tmp_path):
+    crawl_mock_wordbook(tmp_path, NaverWordbookCrawler)
+
+
+def test_crawl_mock_wordbook_cdp(tmp_path):
+    pytest.importorskip("websocket")
+    from cdp_backend import CdpWordbookCrawler
+    crawl_mock_wordbook(tmp_path, CdpWordbookCrawler)
+
+
+def read_rows(path):
+    with open(path, 'r', newline='', encoding='utf-8-sig') as csvfile:
+        return list(csv.reader(csvfile))[1:]
+
+
+def test_select_wordbook_again_after_crawl(tmp_path):
+    # 단어 카드 페이지에서 다시 선택해도 이전 페이지의 카드가 아닌 새 단어장의 첫 페이지부터 추출해야 함
+    config = MockWordbookConfig(wordbooks={"단어": 50, "JLPT N2": 5}, cards_per_page=20, seed=0)
+    crawler = NaverWordbookCrawler(status_callback=lambda message: None, headless=True)
+    crawler.card_settle_delay = crawler.scroll_settle_delay = crawler.page_settle_delay = 0
+    with MockWordbookServer(config) as server:
+        try:
+            crawler.setup_driver_and_navigate(server.main_url)
+            assert crawler.select_wordbook("단어")
+            assert crawler.crawl_wordbook_pages(3, str(tmp_path / "first.csv")) == 50
+            assert crawler.select_wordbook("단어")
+            assert crawler.crawl_wordbook_pages(1, str(tmp_path / "again.csv")) == 20
+            assert crawler.select_wordbook("JLPT N2")
+            assert crawler.crawl_wordbook_pages(1, str(tmp_path / "other.csv")) == 5
+        finally:
+            crawler.quit_driver()
+
+    assert read_rows(str(tmp_path / "again.csv")) == read_rows(str(tmp_path / "first.csv"))[:20]
+    assert len(read_rows(str(tmp_path / "other.csv"))) == 5
+
+
+@pytest.mark.parametrize("recycle_after_pages", [None, 1])
+def test_crawl_beyond_pagination_window(tmp_path, recycle_after_pages):
+    # 13페이지: 페이지 버튼은 10개씩만 보이므로 브라우저 재시작 후 _jump_to_page가 버튼 범위를 넘어 이동해야 함
+    config = MockWordbookConfig(wordbooks={"단어": 65}, cards_per_page=5, seed=0)
+    output_path = str(tmp_path / "out.csv")
+    crawler = NaverWordbookCrawler(status_callback=lambda message: None, headless=True,
+                                   recycle_after_pages=recycle_after_pages)
+    crawler.card_settle_delay = crawler.scroll_settle_delay = crawler.page_settle_delay = 0
+    with MockWordbookServer(config) as server:
+        try:
+            crawler.setup_driver_and_navigate(server.main_url)
+            assert crawler.select_wordbook("단어")
+            assert crawler.crawl_wordbook_pages(13, output_path) == 65
+        finally:
+            crawler.quit_driver()
+
+    rows = read_rows(output_path)
+    assert [row[0] for row in rows] == [config.make_card(card_no)["hiragana"] for card_no in range(65)]
@@ -0,0 +1,181 @@
+import json
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+pytest.importorskip("selenium")
+pytest.importorskip("bs4")
+
+from crawler_module import normalize_wordbook_name
+from export_daemon import JOB_CANCELLED, JOB_DONE, JOB_QUEUED, ExportDaemon, serve
+
+WORDBOOKS = {"단어": "W1", "JLPT N2": "W2"}
+
+
+class StubCrawler:
+    """브라우저 없이 ExportDaemon이 사용하는 크롤러 인터페이스만 흉내 내는 크롤러."""
+
+    def __init__(self, headless=False, dictionary_index=None, recycle_after_pages=None, memory_limit_mb=None):
+        self.driver = None
+        self.status_callback = None
+        self.wordbook_cache = {}
+        self.selected_wordbook = None
+        self.crawled = []  # 실제로 크롤링한 (단어장 이름, 페이지 수)
+
+    def setup_driver_and_navigate(self, url):
+        self.driver = object()
+        self.fetch_wordbook_list(refresh=True)
+
+    def fetch_wordbook_list(self, refresh=False):
+        self.wordbook_cache = {name: {'wbId': wbid, 'url': ''} for name, wbid in WORDBOOKS.items()}
+        return list(self.wordbook_cache)
+
+    def select_wordbook(self, wordbook_name_to_find):
+        for name, wbid in WORDBOOKS.items():
+            if normalize_wordbook_name(name) == normalize_wordbook_name(wordbook_name_to_find):
+                self.selected_wordbook = {'name': name, 'wbId': wbid}
+                return True
+        return False
+
+    def suggest_wordbook_name(self, wordbook_name_to_find):
+        return None
+
+    def crawl_wordbook_pages(self, num_pages, output_filepath, stop_event=None):
+        self.crawled.append((self.selected_wordbook['name'], num_pages))
+        with open(output_filepath, 'w', encoding='utf-8-sig') as csvfile:
+            csvfile.write("히라가나,한자\nたべる,食べる\n")
+        return 1
+
+    def quit_driver(self):
+        self.driver = None
+        self.wordbook_cache = {}
+
+
+def wait_until_finished(job, timeout=5):
+    deadline = time.monotonic() + timeout
+    while job.status in (JOB_QUEUED, "running"):
+        assert time.monotonic() < deadline, f"작업 {job.id}이(가) 끝나지 않음"
+        time.sleep(0.01)
+    return job
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    daemon = ExportDaemon(str(tmp_path), cache_ttl=3600, crawler_class=StubCrawler)
+    daemon.open_browsers()
+    yield daemon
+    daemon.stop()
+
+
+def test_priority_order(daemon):
+    jobs = [daemon.submit("단어", pages, priority=priority, use_cache=False)
+            for pages, priority in ((1, 0), (2, 5), (3, 1), (4, 5))]
+    daemon.start_workers()
+    for job in jobs:
+        wait_until_finished(job)
+    assert [pages for _, pages in daemon.crawlers[0].crawled] == [2, 4, 3, 1]
+
+
+def test_cancel_queued_job(daemon):
+    job = daemon.submit("단어", 1)
+    assert daemon.cancel(job.id)
+    assert job.status == JOB_CANCELLED
+    assert not daemon.cancel(job.id)  # 이미 종료된 작업
+    done = daemon.submit("단어", 2)
+    daemon.start_workers()
+    wait_until_finished(done)
+    assert daemon.crawlers[0].crawled == [("단어", 2)]
+
+
+def test_cache_reuse_by_wordbook_id(daemon):
+    daemon.start_workers()
+    first = wait_until_finished(daemon.submit("단어", 3))
+    assert first.status == JOB_DONE and not first.cached
+
+    # 이름이 정규화 후 같으면 등록 즉시 같은 wbId의 결과를 재사용
+    reused = daemon.submit("단 어", 3)
+    assert reused.status == JOB_DONE and reused.cached
+    assert reused.output_path == first.output_path
+    # 페이지 수나 단어장이 다르면 재사용하지 않음
+    assert not wait_until_finished(daemon.submit("단어", 4)).cached
+    assert not wait_until_finished(daemon.submit("JLPT N2", 3)).cached
+
+    # 등록 시점에 목록이 없으면 select_wordbook 후 wbId로 다시 확인
+    daemon.crawlers[0].wordbook_cache = {}
+    late = daemon.submit("단어", 3)
+    assert late.status == JOB_QUEUED
+    wait_until_finished(late)
+    assert late.cached and late.output_path == first.output_path
+    assert daemon.crawlers[0].crawled == [("단어", 3), ("단어", 4), ("JLPT N2", 3)]
+
+
+def test_expired_jobs_are_evicted(daemon):
+    daemon.start_workers()
+    owner = wait_until_finished(daemon.submit("단어", 1))
+    reused = daemon.submit("단어", 1)
+    assert reused.cached
+
+    # 결과를 재사용한 작업이 먼저 삭제되어도 원래 작업의 파일은 남아 있어야 함
+    reused.finished_at -= 7200
+    daemon.submit("단어", 9, use_cache=False)  # 등록할 때 만료된 작업 정리
+    assert daemon.get_job(reused.id) is None
+    assert os.path.exists(owner.output_path)
+
+    owner.finished_at -= 7200
+    daemon.submit("단어", 9, use_cache=False)
+    assert daemon.get_job(owner.id) is None
+    assert not os.path.exists(owner.output_path)
+    assert daemon.submit("단어", 1).status == JOB_QUEUED  # 캐시에서도 제거됨
+
+
+@pytest.fixture
+def api(daemon):
+    httpd = serve(daemon, port=0)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def request(url, method="GET", data=None):
+    req = urllib.request.Request(url, data=data, method=method, headers={"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(req, timeout=5) as response:
+            return response.status, response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.read()
+
+
+@pytest.mark.parametrize("body", [
+    '{"wordbook": null, "pages": 1}',
+    '{"wordbook": 123, "pages": 1}',
+    '{"wordbook": " ", "pages": 1}',
+    '{"wordbook": "단어", "pages": 0}',
+    '{"wordbook": "단어"}',
+    '{"wordbook": ',
+    '[1, 2]',
+])
+def test_post_validation(api, body):
+    status, _ = request(api + "/jobs", method="POST", data=body.encode("utf-8"))
+    assert status == 400
+
+
+def test_result_status_codes(api, daemon):
+    status, payload = request(api + "/jobs", method="POST", data='{"wordbook": "단어", "pages": 1}'.encode("utf-8"))
+    assert status == 202
+    job_id = json.loads(payload)["id"]
+    assert request(f"{api}/jobs/{job_id}/result")[0] == 409  # 워커를 시작하지 않아 아직 대기 중
+
+    daemon.start_workers()
+    job = wait_until_finished(daemon.get_job(job_id))
+    status, data = request(f"{api}/jobs/{job_id}/result")
+    assert status == 200 and "たべる".encode("utf-8") in data
+
+    os.remove(job.output_path)
+    assert request(f"{api}/jobs/{job_id}/result")[0] == 410
+    assert request(f"{api}/jobs/unknown/result")[0] == 404
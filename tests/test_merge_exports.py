@@ -0,0 +1,59 @@
+import csv
+import os
+
+from merge_exports import collect_input_files, merge_exports
+
+HEADERS = ["히라가나", "한자", "품사", "뜻", "예문", "메모"]
+
+
+def write_export(path, rows, mtime):
+    with open(path, 'w', newline='', encoding='utf-8-sig') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(HEADERS)
+        writer.writerows(rows)
+    os.utime(path, (mtime, mtime))
+
+
+def read_rows(path):
+    with open(path, 'r', newline='', encoding='utf-8-sig') as csvfile:
+        return list(csv.DictReader(csvfile))
+
+
+def test_merge_exports_dedupes_and_prefers_newest(tmp_path):
+    old_path, new_path = str(tmp_path / "old.csv"), str(tmp_path / "new.csv")
+    write_export(old_path, [
+        ["たべる", "食べる", "동사", "먹다", "ご飯を食べる。\n밥을 먹다.", "메모1"],
+        ["のむ", "飲む", "동사", "마시다", "", ""],
+    ], mtime=1000)
+    write_export(new_path, [
+        ["たべる", "食べる", "동사", "먹다; 생활하다", "パンを食べる。\n빵을 먹다.", ""],
+        ["がっこう", "学校", "명사", "학교", "", ""],
+    ], mtime=2000)
+    output_path = str(tmp_path / "merged.csv")
+
+    input_files = collect_input_files([str(tmp_path)], output_path=output_path)
+    assert input_files == [os.path.abspath(old_path), os.path.abspath(new_path)]
+    stats = merge_exports(input_files, output_path, chunk_rows=1, status_callback=lambda message: None)
+
+    rows = read_rows(output_path)
+    assert [row["히라가나"] for row in rows] == ["がっこう", "たべる", "のむ"]
+    taberu = rows[1]
+    assert taberu["뜻"] == "먹다; 생활하다"  # 최신 파일 기준
+    assert taberu["예문"] == "パンを食べる。\n빵을 먹다.\n\nご飯を食べる。\n밥을 먹다."
+    assert taberu["메모"] == "메모1"  # 최신 버전에 없으면 이전 버전으로 채움
+    assert stats["rows_read"] == 4
+    assert stats["unique_rows"] == 3
+    assert stats["runs"] == 4
+
+
+def test_merge_exports_normalizes_width_and_spaces(tmp_path):
+    path = str(tmp_path / "a.csv")
+    write_export(path, [
+        ["ＡＢＣ", "ＡＢＣ", "", "", "", ""],
+        ["ABC ", "ABC", "", "", "", ""],
+        ["", "", "", "", "", ""],
+    ], mtime=1000)
+    output_path = str(tmp_path / "merged.csv")
+    stats = merge_exports([path], output_path, status_callback=lambda message: None)
+    assert stats["unique_rows"] == 1
+    assert stats["rows_read"] == 2  # 단어가 없는 행은 건너뜀
@@ -0,0 +1,44 @@
+import json
+import urllib.error
+import urllib.request
+
+import pytest
+
+from mock_wordbook_server import MockWordbookConfig, MockWordbookServer, parse_wordbook_specs
+
+
+def get_json(url):
+    with urllib.request.urlopen(url, timeout=5) as response:
+        return json.loads(response.read().decode("utf-8"))
+
+
+def api_url(server, path):
+    return server.base_url.split("/wordbook/")[0] + path
+
+
+def test_folders_and_cards():
+    config = MockWordbookConfig(wordbooks={"단어": 45, "JLPT N2": 3}, cards_per_page=20, seed=0)
+    with MockWordbookServer(config) as server:
+        folders = get_json(api_url(server, "/api/folders"))["folders"]
+        assert [(f["name"], f["count"]) for f in folders] == [("단어", 45), ("JLPT N2", 3)]
+
+        wb_id = folders[0]["wbId"]
+        last_page = get_json(api_url(server, f"/api/cards?wbId={wb_id}&page=3"))
+        assert last_page["totalPages"] == 3
+        assert len(last_page["cards"]) == 5
+        assert last_page["cards"][0] == config.make_card(40)
+
+        with urllib.request.urlopen(server.base_url, timeout=5) as response:
+            assert 'id="section_word_card"' in response.read().decode("utf-8")
+
+
+def test_injected_failure():
+    config = MockWordbookConfig(wordbooks={"단어": 10}, fail_rate=1.0, seed=0)
+    with MockWordbookServer(config) as server:
+        with pytest.raises(urllib.error.HTTPError) as excinfo:
+            get_json(api_url(server, f"/api/cards?wbId={config.wordbook_id(0)}&page=1"))
+        assert excinfo.value.code == 500
+
+
+def test_parse_wordbook_specs():
+    assert parse_wordbook_specs(["단어=200", "a=b=3"]) == {"단어": 200, "a=b": 3}